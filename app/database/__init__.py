@@ -1 +1,9 @@
-from session import app_lifespan, get_async_session, engine
+from .session import (
+    app_lifespan,
+    get_async_session,
+    get_pool_stats,
+    pin_to_primary,
+    register_warmup,
+    engine,
+    replica_engine,
+)
@@ -1,46 +1,332 @@
 import os
-import asyncpg
-from fastapi import FastAPI
+import time
+import asyncio
+import logging
+from uuid import uuid4
+from typing import Awaitable, Callable
+from fastapi import FastAPI, Request
 from contextlib import asynccontextmanager
+from sqlalchemy import event, exc
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import make_url, URL
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 
+logger = logging.getLogger(__name__)
 
 ENV = os.getenv("ENV", default="development")
 
+# Connection pool settings, tunable per deployment
+DB_POOL_MODE = os.getenv("DB_POOL_MODE", default="queue")  # "queue" or "null"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", default=10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", default=20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", default=30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", default=1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", default="true").lower() == "true"
+DB_POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", default="true").lower() == "true"
+
+# Optional read replica and how long a client keeps reading from the primary after its own write
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+DB_READ_YOUR_WRITES_SECONDS = int(os.getenv("DB_READ_YOUR_WRITES_SECONDS", default=5))
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+# Prepared statement caching and startup warm-up
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", default=500))
+DB_PGBOUNCER_MODE = os.getenv("DB_PGBOUNCER_MODE", default="false").lower() == "true"
+DB_POOL_WARM_CONNECTIONS = int(
+    os.getenv("DB_POOL_WARM_CONNECTIONS", default=min(DB_POOL_SIZE, 5))
+)
+
 if ENV == "production":
     echo = False
-    async def get_async_conn() -> asyncpg.Connection:
-        # Construct connection string for production using environment variables
+
+    def get_database_url() -> URL:
+        # Construct connection URL for production using environment variables
         connection_name = os.getenv("CLOUD_SQL_CONNECTION_NAME")
-        db_user = os.getenv("DB_USER")
-        db_pass = os.getenv("DB_PASS")
-        db_name = os.getenv("DB_NAME")
-        return f"postgresql+asyncpg://{db_user}:{db_pass}@/{db_name}?host=/cloudsql/{connection_name}"
+        return URL.create(
+            "postgresql+asyncpg",
+            username=os.getenv("DB_USER"),
+            password=os.getenv("DB_PASS"),
+            database=os.getenv("DB_NAME"),
+            query={"host": f"/cloudsql/{connection_name}"},
+        )
+
 else:
     echo = True
-    async def get_async_conn() -> asyncpg.Connection:
-        return await asyncpg.connect(dsn=os.environ["DATABASE_URL"])
 
-# Create an asynchronous SQLAlchemy engine
+    def get_database_url() -> URL:
+        # The server address is read from DATABASE_URL when connecting, see below
+        return make_url("postgresql+asyncpg://")
+
+
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how often, and for how long, checkouts had to wait
+    for a connection to be returned because the pool and its overflow were exhausted.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_count = 0
+        self.wait_time = 0.0
+        self.timeout_count = 0
+
+    def _do_get(self):
+        exhausted = (
+            self._max_overflow > -1
+            and self._overflow >= self._max_overflow
+            and self.checkedin() == 0
+        )
+        if not exhausted:
+            return super()._do_get()
+
+        self.wait_count += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeout_count += 1
+            raise
+        finally:
+            self.wait_time += time.perf_counter() - started
+
+
+def get_connect_args() -> dict:
+    """
+    asyncpg connection arguments controlling prepared statement caching.
+
+    Every statement is prepared by the asyncpg dialect and cached per connection, so
+    repeated queries skip parse/plan. `DB_PGBOUNCER_MODE` turns both caches off and
+    gives each prepared statement a unique name, since a transaction-pooling pgbouncer
+    may hand us a different server connection for every transaction.
+    """
+    if DB_PGBOUNCER_MODE:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+    }
+
+
+def get_engine_options() -> dict:
+    """
+    Build the keyword arguments for `create_async_engine` from the pool settings.
+
+    `DB_POOL_MODE=null` disables client-side pooling entirely, which is what we want
+    when an external pooler (pgbouncer, Cloud SQL Auth Proxy pooling) sits in front of Postgres.
+    """
+    if DB_POOL_MODE == "null":
+        return {"poolclass": NullPool, "connect_args": get_connect_args()}
+    return {
+        "connect_args": get_connect_args(),
+        "poolclass": MonitoredQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_use_lifo": DB_POOL_USE_LIFO,
+    }
+
+
+# Create an asynchronous SQLAlchemy engine backed by a bounded connection pool
 engine = create_async_engine(
-    "postgresql+asyncpg://",
-    creator=get_async_conn,
+    get_database_url(),
     echo=echo,  # Set to False in production
+    **get_engine_options(),
 )
 
+if ENV != "production":
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def _connect_to_database_url(dialect, connection_record, cargs, cparams):
+        """
+        Reads DATABASE_URL for every new connection rather than on import, so that
+        models can be imported (e.g. by unit tests) without a database configured.
+        """
+        url = make_url(os.environ["DATABASE_URL"]).set(drivername="postgresql+asyncpg")
+        cparams.update(dialect.create_connect_args(url)[1])
+
+# Optional engine for read replicas, sharing the same pool settings
+replica_engine = (
+    create_async_engine(
+        make_url(DATABASE_REPLICA_URL).set(drivername="postgresql+asyncpg"),
+        echo=echo,
+        **get_engine_options(),
+    )
+    if DATABASE_REPLICA_URL
+    else None
+)
+
+
+class RoutingSession(Session):
+    """
+    Session that routes statements between the primary and the read replica.
+
+    Writes (flushes and INSERT/UPDATE/DELETE statements) always go to the primary, and
+    once a session has written, every later read in it stays on the primary as well.
+    Reads go to the replica when the statement opted in with the `use_replica`
+    execution option or the whole session was marked as read-only (`info["replica"]`),
+    unless the session is pinned to the primary by the read-your-writes window.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if replica_engine is None:
+            return engine.sync_engine
+        if self._flushing or (clause is not None and clause.is_dml):
+            self.info["wrote"] = True
+            return engine.sync_engine
+        if self.info.get("wrote") or self.info.get("primary_only"):
+            return engine.sync_engine
+        if self.info.get("replica") or (
+            clause is not None
+            and clause.get_execution_options().get("use_replica", False)
+        ):
+            return replica_engine.sync_engine
+        return engine.sync_engine
+
+
 # Session Factory
 async_session_factory = sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False
+    class_=AsyncSession, sync_session_class=RoutingSession, expire_on_commit=False
 )
 
 
-async def get_async_session() -> AsyncSession:
+def get_pool_stats(target_engine=None) -> dict:
+    """
+    Returns a snapshot of the connection pool state for monitoring.
+
+    Args:
+        target_engine (Optional[AsyncEngine]): Engine to inspect, the primary by default.
+
+    Returns:
+        dict: Pool mode, configured size and overflow, checked-out and idle
+            connection counts, plus the number of checkouts that had to wait
+            for a free connection, their total wait time and timeouts.
+    """
+    pool = (target_engine or engine).sync_engine.pool
+    if not isinstance(pool, MonitoredQueuePool):
+        return {"mode": DB_POOL_MODE, "status": pool.status()}
+    return {
+        "mode": DB_POOL_MODE,
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "waits": pool.wait_count,
+        "wait_time_seconds": round(pool.wait_time, 6),
+        "timeouts": pool.timeout_count,
+    }
+
+
+def get_request_session(request: Request) -> AsyncSession:
+    """
+    Returns the session shared by everything handling this request, creating it on first use.
+
+    Nothing is allocated for requests that never ask for a session, and the session
+    only checks out a pooled connection when it first executes a statement.
+    `db_session_middleware` rolls it back on errors and closes it once the response is sent.
+    """
+    session = getattr(request.state, "db", None)
+    if session is None:
+        session = async_session_factory()
+        # Read-only requests may be served entirely from the replica,
+        # unless this client wrote something within the read-your-writes window.
+        session.info["replica"] = request.method in ("GET", "HEAD")
+        session.info["primary_only"] = wrote_recently(request)
+        request.state.db = session
+    return session
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether the client is still inside the read-your-writes window of its last write."""
+    try:
+        primary_until = float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0))
+    except ValueError:
+        return False
+    return primary_until > time.time()
+
+
+def pin_to_primary(response) -> None:
+    """
+    Pins the client's following requests to the primary for `DB_READ_YOUR_WRITES_SECONDS`.
+
+    The window travels with the client as a cookie, so it holds no matter
+    which worker serves the next request.
+    """
+    if replica_engine is None or DB_READ_YOUR_WRITES_SECONDS <= 0:
+        return
+    response.set_cookie(
+        PRIMARY_STICKY_COOKIE,
+        str(time.time() + DB_READ_YOUR_WRITES_SECONDS),
+        max_age=DB_READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+async def get_async_session(request: Request = None) -> AsyncSession:
+    """
+    FastAPI dependency yielding the request-scoped session.
+
+    Outside of an HTTP request (scripts, background jobs, tests) a standalone
+    session is opened and closed around the caller instead.
+    """
+    if request is not None:
+        yield get_request_session(request)
+        return
     async with async_session_factory() as session:
         yield session
 
 
+# Hot statements prepared on every pooled connection at startup
+WARMUP_STATEMENTS: list[Callable[[AsyncSession], Awaitable]] = []
+
+
+def register_warmup(statement: Callable[[AsyncSession], Awaitable]):
+    """
+    Registers a hot query to be prepared on every warmed connection at startup.
+
+    The callable receives a session and should run the query exactly as the
+    application does (same helper, placeholder arguments), so that the prepared
+    statement cache is keyed on the same SQL that real requests will send.
+    """
+    WARMUP_STATEMENTS.append(statement)
+    return statement
+
+
+async def warm_up_pool(target_engine) -> None:
+    """
+    Opens `DB_POOL_WARM_CONNECTIONS` connections at once and prepares the registered
+    hot statements on each of them, leaving them idle in the pool.
+    """
+    if DB_POOL_MODE == "null" or DB_POOL_WARM_CONNECTIONS <= 0:
+        return
+
+    async def warm_connection():
+        async with target_engine.connect() as conn:
+            if DB_PGBOUNCER_MODE:
+                return
+            async with AsyncSession(bind=conn) as session:
+                for statement in WARMUP_STATEMENTS:
+                    try:
+                        await statement(session)
+                    except SQLAlchemyError as e:
+                        logger.warning("Statement warm-up failed: %s", e)
+                        await session.rollback()
+
+    await asyncio.gather(
+        *(warm_connection() for _ in range(DB_POOL_WARM_CONNECTIONS))
+    )
+
+
 @asynccontextmanager
 async def app_lifespan(app: FastAPI):
     # Startup logic here
@@ -48,6 +334,11 @@ async def app_lifespan(app: FastAPI):
         # Optional: Create database tables
         # await conn.run_sync(Base.metadata.create_all)
         pass
+    await warm_up_pool(engine)
+    if replica_engine is not None:
+        await warm_up_pool(replica_engine)
     yield  # The application is now ready to handle requests.
     # Shutdown logic here
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
@@ -3,8 +3,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.database import get_async_session, app_lifespan
-from app.models.common import Base
+from app.database import (
+    get_async_session,
+    get_pool_stats,
+    pin_to_primary,
+    app_lifespan,
+    replica_engine,
+)
+from app.models.common import Base, get_cache_stats, wait_for_cache_invalidations
 from app.routers.users import users_router, auth_router
 
 
@@ -14,18 +20,29 @@ app = FastAPI(title="Wardrobers API", version="2.0", lifespan=app_lifespan)
 # Middleware for DB session management
 @app.middleware("http")
 async def db_session_middleware(request: Request, call_next):
-    response = None
-    request.state.db = await get_async_session()
+    # The session itself is created lazily by `get_async_session` the first time a
+    # route depends on it, so endpoints that never query the DB never open one.
     try:
-        # Attach a new session to the request state
         response = await call_next(request)
     except Exception as e:
-        # Handle exceptions and potentially roll back transactions here
-        request.state.db.rollback()
+        # Roll back whatever the request left uncommitted
+        session = getattr(request.state, "db", None)
+        if session is not None:
+            await session.rollback()
         raise e
+    else:
+        # Keep this client's next reads on the primary so it sees its own writes
+        session = getattr(request.state, "db", None)
+        if session is not None:
+            if session.info.get("wrote"):
+                pin_to_primary(response)
+            # Don't answer before the cache stops serving what this request changed
+            await wait_for_cache_invalidations(session)
     finally:
         # Always close the session after the request is done
-        request.state.db.close()
+        session = getattr(request.state, "db", None)
+        if session is not None:
+            await session.close()
     return response
 
 
@@ -81,5 +98,25 @@ async def liveness_check(db_session: AsyncSession = Depends(get_async_session)):
         raise HTTPException(status_code=503, detail=f"Service Unavailable: {str(e)}")
 
 
+@app.get("/healthz/pool", tags=["Test"])
+async def pool_stats():
+    """
+    Exposes database connection pool statistics (checked-out, idle, waits) for monitoring.
+    """
+    stats = {"database_pool": get_pool_stats()}
+    if replica_engine is not None:
+        stats["replica_pool"] = get_pool_stats(replica_engine)
+    return stats
+
+
+@app.get("/healthz/cache", tags=["Test"])
+async def cache_stats():
+    """
+    Exposes cache hit/miss/error counters, Redis command latencies and the circuit
+    breaker state for monitoring.
+    """
+    return get_cache_stats()
+
+
 app.include_router(auth_router.router, prefix="/auth", tags=["Authentication"])
 app.include_router(users_router.router, prefix="/users", tags=["Users"])
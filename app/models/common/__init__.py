@@ -1,4 +1,7 @@
 from .base_model import ModelBase, Base, BaseMixin
 from .bulk_actions_model import BulkActionsMixin
 from .cache_model import CachingMixin
+from .cache_redis import get_cache_stats
+from .cache_invalidation import track_cache_writes, wait_for_cache_invalidations
 from .search_model import SearchMixin
+from .data_loader import SessionLoader
@@ -1,4 +1,13 @@
-from typing import Any, Optional
+import json
+import base64
+import hashlib
+import uuid
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional, Sequence
 from abc import ABC, abstractmethod
 from sqlalchemy.orm import (
     declared_attr,
@@ -6,12 +15,31 @@ from sqlalchemy.orm import (
     mapped_column,
     RelationshipProperty,
     aliased,
+    load_only,
+    raiseload,
 )
-from sqlalchemy import Column, DateTime, func, select, update
+from sqlalchemy import (
+    Column,
+    DateTime,
+    func,
+    select,
+    update,
+    and_,
+    or_,
+    tuple_,
+    bindparam,
+    inspect,
+    text,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Generative
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from sqlalchemy.ext.declarative import declared_attr, declarative_base
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import UUID
 
+from .data_loader import SessionLoader
+
 
 class ModelBase:
     @declared_attr
@@ -21,6 +49,33 @@ class ModelBase:
 
 Base = declarative_base(cls=ModelBase)
 
+# Maximum number of distinct (model, query shape) statements kept by `BaseMixin._build_query`
+QUERY_CACHE_SIZE = 512
+
+# Exact counts are cached per process for this many seconds, up to COUNT_CACHE_SIZE entries
+COUNT_CACHE_TTL = 60
+COUNT_CACHE_SIZE = 1024
+# In "auto" mode, tables estimated above this many rows get an estimated count
+COUNT_ESTIMATE_THRESHOLD = 100_000
+
+_count_cache: dict[tuple, tuple[float, int]] = {}
+
+
+class Explain(Generative, Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON)` wrapper for a SELECT, rendered with the statement's bound parameters.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
 
 class BaseMixin(ABC, metaclass=DeclarativeMeta):
     """
@@ -41,33 +96,100 @@ class BaseMixin(ABC, metaclass=DeclarativeMeta):
     deleted_at = Column(DateTime)
 
     @classmethod
-    async def get_by_id(cls, db_session: AsyncSession, _id: UUID):
+    def _plain_columns(cls) -> list[str]:
+        """
+        Names of the mapped columns loaded with every row: deferred and generated
+        (`Computed`) columns, such as `SearchMixin.search_vector`, are left out.
+        """
+        return [
+            attr.key
+            for attr in inspect(cls).column_attrs
+            if not attr.deferred and attr.columns[0].computed is None
+        ]
+
+    @classmethod
+    def _projection_options(cls, projection: Optional[Sequence[str]]) -> tuple:
+        """
+        Loader options restricting a query to the `projection` columns.
+
+        The other columns are deferred, so wide ones such as `Products.description` are
+        neither sent over the wire nor hydrated. `id` and `deleted_at` are always loaded.
+        Relationships aren't loaded either, eager ones included. A lazy load isn't
+        available on an async session, so accessing a deferred column or a relationship
+        afterwards raises at once: only ask for what the caller reads.
+        """
+        if not projection:
+            return ()
+        return (
+            load_only(
+                *(getattr(cls, field) for field in projection),
+                cls.deleted_at,
+                raiseload=True,
+            ),
+            raiseload("*"),
+        )
+
+    @classmethod
+    async def get_by_id(
+        cls,
+        db_session: AsyncSession,
+        _id: UUID,
+        projection: Optional[Sequence[str]] = None,
+    ):
         """
         Retrieve a model instance by its ID. Handles async session execution.
+        Like the other read helpers, it is served from the read replica when one is configured.
+
+        Lookups are batched per session: every `get_by_id` issued in the same event-loop
+        tick is answered by one `get_by_ids` query per model, and ids already loaded
+        in the current transaction are returned without touching the database.
+
+        Args:
+            projection (Optional[Sequence[str]]): Columns to load, all of them by default.
         """
-        async with db_session as session:
-            result = await session.execute(
-                select(cls).where(cls.id == _id, cls.deleted_at.is_(None))
-            )
-            return result.scalars().first()
+        return await SessionLoader.for_session(db_session).load(
+            cls, _id, tuple(projection) if projection else None
+        )
 
     @classmethod
-    async def get_all(cls, db_session: AsyncSession):
+    async def get_all(
+        cls, db_session: AsyncSession, projection: Optional[Sequence[str]] = None
+    ):
         """
         Retrieve all non-deleted instances of the model.
+        Use `stream` instead for large tables.
+
+        Args:
+            projection (Optional[Sequence[str]]): Columns to load, all of them by default.
         """
-        async with db_session as session:
-            result = await session.execute(select(cls).where(cls.deleted_at.is_(None)))
-            return result.scalars().all()
+        result = await db_session.execute(
+            select(cls)
+            .where(cls.deleted_at.is_(None))
+            .options(*cls._projection_options(projection))
+            .execution_options(use_replica=True)
+        )
+        return result.scalars().all()
 
     @classmethod
-    async def get_by_ids(cls, db_session: AsyncSession, ids: list[UUID]):
+    async def get_by_ids(
+        cls,
+        db_session: AsyncSession,
+        ids: list[UUID],
+        projection: Optional[Sequence[str]] = None,
+    ):
         """
         Retrieve multiple model instances by their IDs.
+
+        Args:
+            projection (Optional[Sequence[str]]): Columns to load, all of them by default.
         """
-        async with db_session as session:
-            result = await session.execute(select(cls).where(cls.id.in_(ids)))
-            return result.scalars().all()
+        result = await db_session.execute(
+            select(cls)
+            .where(cls.id.in_(ids))
+            .options(*cls._projection_options(projection))
+            .execution_options(use_replica=True)
+        )
+        return result.scalars().all()
 
     async def create(self, db_session: AsyncSession, **kwargs):
         """
@@ -84,87 +206,168 @@ class BaseMixin(ABC, metaclass=DeclarativeMeta):
         """
         Update an existing model instance.
         """
-        async with db_session as session:
-            await session.execute(
-                update(self.__class__)
-                .where(self.__class__.id == self.id)
-                .values(**kwargs)
-            )
-            await session.commit()
-            await session.refresh(self)
+        await db_session.execute(
+            update(self.__class__)
+            .where(self.__class__.id == self.id)
+            .values(**kwargs)
+            .execution_options(invalidates_cache=[self.id])
+        )
+        await db_session.commit()
+        await db_session.refresh(self)
         return self
 
     async def soft_delete(self, db_session: AsyncSession):
         """
         Mark the model instance as deleted (soft delete).
         """
-        async with db_session as session:
-            setattr(self, "is_active", False)
-            self.deleted_at = func.now()
-            await session.commit()
-            await session.refresh(self)
+        setattr(self, "is_active", False)
+        self.deleted_at = func.now()
+        await db_session.commit()
+        await db_session.refresh(self)
         return self
 
     async def delete(self, db_session: AsyncSession):
         """
         Permanently delete the model instance (hard delete).
         """
-        async with db_session as session:
-            self.soft_delete(session)
-            await session.delete(self)
-            await session.commit()
+        self.soft_delete(db_session)
+        await db_session.delete(self)
+        await db_session.commit()
+
+    @staticmethod
+    def _filter_operator(value: Any) -> str:
+        """
+        Classifies a filter value into the operator it is applied with.
+        """
+        if isinstance(value, dict) and "min" in value and "max" in value:
+            return "between"
+        if isinstance(value, list):
+            return "in"
+        if value is None:
+            return "is_null"
+        return "eq"
 
     @classmethod
-    async def _apply_filters(
-        cls, query: select, filters: Optional[dict[str, Any]]
-    ) -> select:
+    def _query_shape(
+        cls,
+        filters: Optional[dict[str, Any]],
+        relationships: Optional[dict[str, tuple[str, Any]]],
+        order_by: Optional[list[tuple[str, str]]],
+        projection: Optional[Sequence[str]] = None,
+    ) -> tuple:
+        """
+        Reduces the query arguments to their shape: which columns are filtered and how,
+        which relationship fields are matched, the ordering and the projected columns,
+        without the values.
+        """
+        return (
+            tuple(
+                (attribute, cls._filter_operator(value))
+                for attribute, value in (filters or {}).items()
+            ),
+            tuple(
+                (rel_attr, rel_field)
+                for rel_attr, (rel_field, _) in (relationships or {}).items()
+            ),
+            tuple((field, direction.lower()) for field, direction in (order_by or [])),
+            tuple(projection) if projection else None,
+        )
+
+    @classmethod
+    def _query_params(
+        cls,
+        filters: Optional[dict[str, Any]],
+        relationships: Optional[dict[str, tuple[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Extracts the values bound to the placeholders of a cached query shape.
         """
-        Applies filter conditions to the query.
-        """
-        if filters:
-            for attribute, value in filters.items():
-                column = cls.__table__.c.get(attribute)
-                if isinstance(value, dict) and "min" in value and "max" in value:
-                    query = query.where(column.between(value["min"], value["max"]))
-                elif isinstance(value, list):
-                    query = query.where(column.in_(value))
-                else:
-                    query = query.where(column == value)
+        params = {}
+        for attribute, value in (filters or {}).items():
+            operator = cls._filter_operator(value)
+            if operator == "between":
+                params[f"f_{attribute}_min"] = value["min"]
+                params[f"f_{attribute}_max"] = value["max"]
+            elif operator != "is_null":
+                params[f"f_{attribute}"] = value
+        for rel_attr, (_, rel_filter) in (relationships or {}).items():
+            params[f"r_{rel_attr}"] = rel_filter
+        return params
+
+    @classmethod
+    def _apply_filters(cls, query: select, filter_shape: tuple) -> select:
+        """
+        Applies filter conditions to the query, with a bound parameter per value.
+        """
+        for attribute, operator in filter_shape:
+            column = cls.__table__.c.get(attribute)
+            if operator == "between":
+                query = query.where(
+                    column.between(
+                        bindparam(f"f_{attribute}_min"), bindparam(f"f_{attribute}_max")
+                    )
+                )
+            elif operator == "in":
+                query = query.where(
+                    column.in_(bindparam(f"f_{attribute}", expanding=True))
+                )
+            elif operator == "is_null":
+                query = query.where(column.is_(None))
+            else:
+                query = query.where(column == bindparam(f"f_{attribute}"))
         return query
 
     @classmethod
-    async def _apply_relationship_filters(
-        cls, query: select, relationships: Optional[dict[str, tuple[str, Any]]]
+    def _apply_relationship_filters(
+        cls, query: select, relationship_shape: tuple
     ) -> select:
         """
         Applies filters based on related model attributes.
         """
-        if relationships:
-            for rel_attr, (rel_field, rel_filter) in relationships.items():
-                relationship: RelationshipProperty = getattr(cls, rel_attr)
-                related_cls = relationship.mapper.class_
-                rel_alias = aliased(related_cls)
-                query = query.join(rel_alias, relationship).filter(
-                    getattr(rel_alias, rel_field) == rel_filter
-                )
+        for rel_attr, rel_field in relationship_shape:
+            relationship: RelationshipProperty = getattr(cls, rel_attr)
+            related_cls = relationship.mapper.class_
+            rel_alias = aliased(related_cls)
+            query = query.join(rel_alias, relationship).filter(
+                getattr(rel_alias, rel_field) == bindparam(f"r_{rel_attr}")
+            )
         return query
 
     @classmethod
-    async def _apply_ordering(
-        cls, query: select, order_by: Optional[list[tuple[str, str]]]
-    ) -> select:
+    def _apply_ordering(cls, query: select, order_shape: tuple) -> select:
         """
         Applies ordering to the query.
         """
-        if order_by:
-            for field, direction in order_by:
-                column = cls.__table__.c.get(field)
-                if direction.lower() == "desc":
-                    query = query.order_by(column.desc())
-                else:
-                    query = query.order_by(column)
+        for field, direction in order_shape:
+            column = cls.__table__.c.get(field)
+            if direction == "desc":
+                query = query.order_by(column.desc())
+            else:
+                query = query.order_by(column)
         return query
 
+    @classmethod
+    @lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _build_query(cls, shape: tuple, limited: bool, offset: bool) -> select:
+        """
+        Builds, once per model and query shape, the SELECT used by `filter` and friends.
+
+        Values are left as bound parameters, so the same statement object is reused for
+        every call with this shape: its cache key is memoized on the object and
+        SQLAlchemy's compiled cache is hit on every execution.
+        """
+        filter_shape, relationship_shape, order_shape, projection = shape
+        query = select(cls).options(*cls._projection_options(projection))
+        query = cls._apply_filters(query, filter_shape)
+        query = cls._apply_relationship_filters(query, relationship_shape)
+        query = cls._apply_ordering(query, order_shape)
+
+        if limited:
+            query = query.limit(bindparam("_limit"))
+        if offset:
+            query = query.offset(bindparam("_offset"))
+        return query.execution_options(use_replica=True)
+
     @classmethod
     async def filter(
         cls,
@@ -174,6 +377,7 @@ class BaseMixin(ABC, metaclass=DeclarativeMeta):
         order_by: Optional[list[tuple[str, str]]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        projection: Optional[Sequence[str]] = None,
     ) -> list:
         """
         Perform advanced filtering, ordering, and pagination asynchronously.
@@ -185,23 +389,71 @@ class BaseMixin(ABC, metaclass=DeclarativeMeta):
             order_by (Optional[List[Tuple[str, str]]]): Ordering criteria.
             limit (Optional[int]): Maximum number of results.
             offset (Optional[int]): Result offset for pagination.
+            projection (Optional[Sequence[str]]): Columns to load, all of them by default.
 
         Returns:
             List: A list of filtered and ordered model instances.
         """
-        query = select(cls)
-        query = await cls._apply_filters(query, filters)
-        query = await cls._apply_relationship_filters(query, relationships)
-        query = await cls._apply_ordering(query, order_by)
-
+        query = cls._build_query(
+            cls._query_shape(filters, relationships, order_by, projection),
+            limited=bool(limit),
+            offset=bool(offset),
+        )
+        params = cls._query_params(filters, relationships)
         if limit:
-            query = query.limit(limit)
+            params["_limit"] = limit
         if offset:
-            query = query.offset(offset)
+            params["_offset"] = offset
 
-        async with db_session as session:
-            result = await session.execute(query)
-            return result.scalars().all()
+        result = await db_session.execute(query, params)
+        return result.scalars().all()
+
+    @classmethod
+    async def stream(
+        cls,
+        db_session: AsyncSession,
+        filters: Optional[dict[str, Any]] = None,
+        relationships: Optional[dict[str, tuple[str, Any]]] = None,
+        order_by: Optional[list[tuple[str, str]]] = None,
+        projection: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator:
+        """
+        Iterate over filtered model instances without materialising the whole result.
+
+        Rows are read from a server-side cursor `batch_size` at a time, so memory stays
+        flat on tables such as articles, transactions or cleaning logs. Relationships are
+        not loaded while streaming (eager collections can't be combined with batched
+        fetching); accessing one raises instead of issuing a query per row.
+        Soft-deleted rows are skipped, like in `get_all`.
+
+        Args:
+            db_session (AsyncSession): The async database session. It must stay open
+                for the whole iteration.
+            filters (Optional[Dict[str, Any]]): Filtering criteria for the main model.
+            relationships (Optional[Dict[str, Tuple[str, Any]]]): Filtering based on related models.
+            order_by (Optional[List[Tuple[str, str]]]): Ordering criteria.
+            projection (Optional[Sequence[str]]): Columns to load, all of them by default.
+            batch_size (int): Number of rows fetched per round trip.
+
+        Yields:
+            Model instances, one at a time.
+        """
+        query = (
+            cls._build_query(
+                cls._query_shape(filters, relationships, order_by, projection),
+                limited=False,
+                offset=False,
+            )
+            .where(cls.deleted_at.is_(None))
+            .options(raiseload("*"))
+            .execution_options(yield_per=batch_size)
+        )
+        result = await db_session.stream(
+            query, cls._query_params(filters, relationships)
+        )
+        async for instance in result.scalars():
+            yield instance
 
     @classmethod
     async def paginate(
@@ -212,6 +464,7 @@ class BaseMixin(ABC, metaclass=DeclarativeMeta):
         filters: Optional[dict[str, any]] = None,
         relationships: Optional[dict[str, tuple[str, Any]]] = None,
         order_by: Optional[list[tuple[str, str]]] = None,
+        projection: Optional[Sequence[str]] = None,
     ) -> list:
         """
         Retrieve paginated model instances asynchronously.
@@ -223,9 +476,14 @@ class BaseMixin(ABC, metaclass=DeclarativeMeta):
             filters (Optional[Dict[str, Any]]): Filtering criteria.
             relationships (Optional[Dict[str, Tuple[str, Any]]]): Filtering based on related models.
             order_by (Optional[List[Tuple[str, str]]]): Ordering criteria.
+            projection (Optional[Sequence[str]]): Columns to load, all of them by default.
 
         Returns:
             List: A list of model instances for the specified page.
+
+        Note:
+            The offset grows with the page number, so deep pages get slower.
+            Prefer `paginate_by_cursor` for long lists (catalog, orders, transactions).
         """
         offset = (page - 1) * page_size
         return await cls.filter(
@@ -235,7 +493,287 @@ class BaseMixin(ABC, metaclass=DeclarativeMeta):
             order_by=order_by,
             limit=page_size,
             offset=offset,
+            projection=projection,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _build_count_query(cls, shape: tuple) -> select:
+        """
+        Builds, once per model and query shape, the COUNT(*) matching `filter`.
+        """
+        filter_shape, relationship_shape, _, _ = shape
+        query = select(func.count()).select_from(cls)
+        query = cls._apply_filters(query, filter_shape)
+        query = cls._apply_relationship_filters(query, relationship_shape)
+        return query.execution_options(use_replica=True)
+
+    @classmethod
+    async def _estimate_table_rows(cls, db_session: AsyncSession) -> int:
+        """
+        Reads the planner's row estimate for the whole table from `pg_class.reltuples`.
+        Returns -1 when the table has never been analyzed.
+        """
+        result = await db_session.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = CAST(:table_name AS regclass)"
+            ).execution_options(use_replica=True),
+            {"table_name": cls.__table__.name},
+        )
+        estimate = result.scalar()
+        return -1 if estimate is None else int(estimate)
+
+    @classmethod
+    async def _estimate_query_rows(
+        cls, db_session: AsyncSession, shape: tuple, params: dict[str, Any]
+    ) -> int:
+        """
+        Reads the planner's row estimate for a filtered query from its EXPLAIN plan.
+        """
+        query = cls._build_query(shape, limited=False, offset=False)
+        result = await db_session.execute(
+            Explain(query).execution_options(use_replica=True), params
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @classmethod
+    async def count(
+        cls,
+        db_session: AsyncSession,
+        filters: Optional[dict[str, Any]] = None,
+        relationships: Optional[dict[str, tuple[str, Any]]] = None,
+        mode: str = "exact",
+        ttl: int = COUNT_CACHE_TTL,
+    ) -> int:
+        """
+        Count the rows `filter` would return with the same criteria, e.g. to show totals next to `paginate`.
+
+        Args:
+            db_session (AsyncSession): The async database session.
+            filters (Optional[Dict[str, Any]]): Filtering criteria.
+            relationships (Optional[Dict[str, Tuple[str, Any]]]): Filtering based on related models.
+            mode (str): How to count:
+                - "exact": COUNT(*), cached in process for `ttl` seconds.
+                - "estimated": the planner's estimate (`pg_class.reltuples` without filters,
+                  the EXPLAIN row estimate with filters). Cheap, but only approximate.
+                - "auto": estimated for tables above `COUNT_ESTIMATE_THRESHOLD` rows, exact otherwise.
+            ttl (int): Seconds an exact count is reused for; 0 disables the cache.
+
+        Returns:
+            int: The (possibly estimated) number of matching rows.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in ("exact", "estimated", "auto"):
+            raise ValueError(f"Unknown count mode: {mode}")
+
+        shape = cls._query_shape(filters, relationships, None)
+        params = cls._query_params(filters, relationships)
+
+        if mode != "exact":
+            table_rows = await cls._estimate_table_rows(db_session)
+            if table_rows >= 0 and (
+                mode == "estimated" or table_rows >= COUNT_ESTIMATE_THRESHOLD
+            ):
+                if not filters and not relationships:
+                    return table_rows
+                return await cls._estimate_query_rows(db_session, shape, params)
+
+        cache_key = (cls, shape, json.dumps(params, sort_keys=True, default=str))
+        cached = _count_cache.get(cache_key)
+        if ttl and cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        result = await db_session.execute(cls._build_count_query(shape), params)
+        total = result.scalar()
+
+        if ttl:
+            if len(_count_cache) >= COUNT_CACHE_SIZE:
+                _count_cache.pop(next(iter(_count_cache)))
+            _count_cache[cache_key] = (time.monotonic() + ttl, total)
+        return total
+
+    @classmethod
+    def _keyset_order(
+        cls, order_by: Optional[list[tuple[str, str]]]
+    ) -> list[tuple[str, str]]:
+        """
+        Normalizes the ordering used for keyset pagination.
+
+        Defaults to newest first, and always ends with `id` so that rows sharing
+        the same sort values still have a strict, stable order. Directions are
+        lowercased, so that cursors don't depend on how they were spelled.
+        """
+        order_by = [
+            (field, direction.lower())
+            for field, direction in order_by or [("created_at", "desc")]
+        ]
+        if all(field != "id" for field, _ in order_by):
+            order_by.append(("id", order_by[-1][1]))
+        return order_by
+
+    @staticmethod
+    def _encode_cursor_value(value: Any) -> list:
+        if isinstance(value, datetime):
+            return ["dt", value.isoformat()]
+        if isinstance(value, date):
+            return ["d", value.isoformat()]
+        if isinstance(value, uuid.UUID):
+            return ["uuid", str(value)]
+        if isinstance(value, Decimal):
+            return ["dec", str(value)]
+        if isinstance(value, Enum):
+            # By name, as SQLAlchemy stores them
+            return ["enum", value.name]
+        return ["raw", value]
+
+    @classmethod
+    def _decode_cursor_value(cls, tagged: list, field: str) -> Any:
+        kind, value = tagged
+        decoders = {
+            "dt": datetime.fromisoformat,
+            "d": date.fromisoformat,
+            "uuid": uuid.UUID,
+            "dec": Decimal,
+            "enum": lambda name: cls.__table__.c[field].type.enum_class[name],
+            "raw": lambda raw: raw,
+        }
+        return decoders[kind](value)
+
+    @classmethod
+    def _order_fingerprint(cls, order_by: list[tuple[str, str]]) -> str:
+        shape = f"{cls.__name__}:{order_by}"
+        return hashlib.sha256(shape.encode()).hexdigest()[:8]
+
+    @classmethod
+    def encode_cursor(cls, instance, order_by: list[tuple[str, str]]) -> str:
+        """
+        Builds the opaque cursor pointing just after `instance` for the given ordering.
+        """
+        payload = {
+            "o": cls._order_fingerprint(order_by),
+            "v": [
+                cls._encode_cursor_value(getattr(instance, field))
+                for field, _ in order_by
+            ],
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode_cursor(cls, cursor: str, order_by: list[tuple[str, str]]) -> list:
+        """
+        Decodes a cursor produced by `encode_cursor` back into the sort values.
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for a different ordering.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = [
+                cls._decode_cursor_value(value, field)
+                for value, (field, _) in zip(payload["v"], order_by)
+            ]
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError("Invalid pagination cursor.") from e
+        if payload.get("o") != cls._order_fingerprint(order_by) or len(values) != len(
+            order_by
+        ):
+            raise ValueError("Pagination cursor does not match the requested ordering.")
+        return values
+
+    @classmethod
+    def _keyset_condition(cls, order_by: list[tuple[str, str]], values: list):
+        """
+        Builds the seek predicate selecting the rows that come after `values`.
+
+        When every column is sorted in the same direction a row-value comparison is
+        used, which PostgreSQL can serve directly from a composite index.
+        """
+        columns = [cls.__table__.c.get(field) for field, _ in order_by]
+        directions = {direction.lower() for _, direction in order_by}
+        if len(directions) == 1:
+            if directions == {"desc"}:
+                return tuple_(*columns) < tuple_(*values)
+            return tuple_(*columns) > tuple_(*values)
+
+        conditions = []
+        for index, (column, (_, direction)) in enumerate(zip(columns, order_by)):
+            seek = (
+                column < values[index]
+                if direction.lower() == "desc"
+                else column > values[index]
+            )
+            equal_prefix = [columns[i] == values[i] for i in range(index)]
+            conditions.append(and_(*equal_prefix, seek))
+        return or_(*conditions)
+
+    @classmethod
+    async def paginate_by_cursor(
+        cls,
+        db_session: AsyncSession,
+        page_size: int,
+        cursor: Optional[str] = None,
+        filters: Optional[dict[str, Any]] = None,
+        relationships: Optional[dict[str, tuple[str, Any]]] = None,
+        order_by: Optional[list[tuple[str, str]]] = None,
+        projection: Optional[Sequence[str]] = None,
+    ) -> tuple[list, Optional[str]]:
+        """
+        Retrieve a page of model instances using keyset (cursor) pagination.
+
+        Instead of skipping `offset` rows, the query seeks directly past the last row
+        of the previous page, so deep pages cost the same as the first one. The
+        ordering columns should be non-nullable and covered by an index; `id` is
+        appended as a tie-breaker when missing.
+
+        Args:
+            db_session (AsyncSession): The async database session.
+            page_size (int): Number of items per page.
+            cursor (Optional[str]): The `next_cursor` returned for the previous page, None for the first page.
+            filters (Optional[Dict[str, Any]]): Filtering criteria.
+            relationships (Optional[Dict[str, Tuple[str, Any]]]): Filtering based on related models.
+            order_by (Optional[List[Tuple[str, str]]]): Ordering criteria, newest first by default.
+            projection (Optional[Sequence[str]]): Columns to load, all of them by default.
+                The ordering columns are always added, since the next cursor is built from them.
+
+        Returns:
+            Tuple[List, Optional[str]]: The model instances for the page and the cursor
+                of the next page (None when this is the last page).
+
+        Raises:
+            ValueError: If the cursor is invalid or does not match the ordering.
+        """
+        order_by = cls._keyset_order(order_by)
+        if projection:
+            projection = list(dict.fromkeys([*projection, *(f for f, _ in order_by)]))
+
+        query = cls._build_query(
+            cls._query_shape(filters, relationships, order_by, projection),
+            limited=True,
+            offset=False,
         )
+        if cursor:
+            query = query.where(
+                cls._keyset_condition(order_by, cls.decode_cursor(cursor, order_by))
+            )
+        params = cls._query_params(filters, relationships)
+        params["_limit"] = page_size + 1
+
+        result = await db_session.execute(query, params)
+        items = result.scalars().all()
+
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            next_cursor = cls.encode_cursor(items[-1], order_by)
+        return items, next_cursor
 
     @abstractmethod
     def validate(self):  # Method should be created later and updated
@@ -1,8 +1,36 @@
-from typing import Any, Optional
-from sqlalchemy import insert, update, delete, func, select, and_
+import time
+import asyncio
+import inspect
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional, Sequence, Union
+from sqlalchemy import (
+    insert,
+    update,
+    delete,
+    func,
+    select,
+    text,
+    values,
+    column as values_column,
+    literal_column,
+)
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+from app.database.session import async_session_factory
+from .cache_invalidation import track_cache_writes
+
+
+# bulk_create switches to COPY FROM STDIN from this many rows on
+COPY_THRESHOLD = 1000
+# Rows sent per COPY
+COPY_CHUNK_SIZE = 10_000
+# Rows per UPDATE ... FROM (VALUES ...) statement, kept well under the 32767 bind parameter limit
+UPDATE_CHUNK_SIZE = 1000
+# Rows per INSERT ... ON CONFLICT statement
+UPSERT_CHUNK_SIZE = 1000
+# Ids per DELETE / soft delete UPDATE statement
+DELETE_CHUNK_SIZE = 5000
 
 
 class BulkActionsMixin(metaclass=DeclarativeMeta):
@@ -10,71 +38,436 @@ class BulkActionsMixin(metaclass=DeclarativeMeta):
     Mixin for performing bulk operations on database models, featuring:
 
     - Asynchronous operations for enhanced concurrency.
-    - Optimized bulk inserts and updates.
+    - Optimized bulk inserts (COPY FROM STDIN for large batches) and updates.
     - Bulk soft and hard deletes.
-    - Bulk upsert operation (insert or update).
+    - Bulk upsert operation (INSERT ... ON CONFLICT DO UPDATE).
+    - Work split into chunks, committed per chunk or all at once, optionally
+      running several chunks concurrently, with progress reporting.
     - Type hints for improved clarity.
+
+    Every bulk method accepts the same chunking arguments:
+
+    - `chunk_size`: rows (or ids) per chunk.
+    - `atomic`: commit once after the last chunk (True, all-or-nothing) or after
+      every chunk (False), which keeps transactions and row locks short.
+    - `concurrency`: how many chunks run at the same time. Each concurrent chunk
+      runs in its own session on its own pooled connection, so it requires
+      `atomic=False` and chunks that don't depend on each other.
+    - `progress`: called (or awaited) after every chunk with a dict holding
+      `chunks_done`, `chunks_total`, `rows_done`, `rows_total`,
+      `elapsed_seconds` and `rows_per_second`.
     """
 
     @classmethod
-    async def bulk_create(cls, db_session: AsyncSession, items: list[dict[str, Any]]):
+    async def _run_chunked(
+        cls,
+        db_session: AsyncSession,
+        rows: Sequence[Any],
+        chunk_size: int,
+        apply: Callable[[AsyncSession, Sequence[Any]], Awaitable[Any]],
+        atomic: bool = True,
+        concurrency: int = 1,
+        progress: Optional[Callable[[dict[str, Any]], Any]] = None,
+    ) -> list[Any]:
+        """
+        Splits `rows` into chunks of `chunk_size` and runs `apply(session, chunk)` on each.
+
+        Args:
+            db_session (AsyncSession): The caller's session, used for sequential chunks.
+            rows (Sequence[Any]): The items or ids to process.
+            chunk_size (int): Rows per chunk.
+            apply (Callable): Coroutine function executing one chunk, without committing.
+            atomic (bool): Commit once at the end instead of after every chunk.
+            concurrency (int): Maximum number of chunks running at the same time.
+            progress (Optional[Callable]): Progress callback, see the class docstring.
+
+        Returns:
+            List[Any]: What `apply` returned for each chunk, in chunk order.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if concurrency > 1 and atomic:
+            raise ValueError(
+                "Concurrent chunks run in separate transactions; pass atomic=False"
+            )
+
+        chunks = [
+            rows[start : start + chunk_size] for start in range(0, len(rows), chunk_size)
+        ]
+        results: list[Any] = [None] * len(chunks)
+        state = {"chunks_done": 0, "rows_done": 0}
+        started = time.perf_counter()
+
+        async def report(chunk: Sequence[Any]) -> None:
+            state["chunks_done"] += 1
+            state["rows_done"] += len(chunk)
+            if progress is None:
+                return
+            elapsed = time.perf_counter() - started
+            outcome = progress(
+                {
+                    "chunks_done": state["chunks_done"],
+                    "chunks_total": len(chunks),
+                    "rows_done": state["rows_done"],
+                    "rows_total": len(rows),
+                    "elapsed_seconds": elapsed,
+                    "rows_per_second": state["rows_done"] / elapsed if elapsed else 0.0,
+                }
+            )
+            if inspect.isawaitable(outcome):
+                await outcome
+
+        if concurrency == 1:
+            try:
+                for index, chunk in enumerate(chunks):
+                    results[index] = await apply(db_session, chunk)
+                    if not atomic:
+                        await db_session.commit()
+                    await report(chunk)
+                if atomic:
+                    await db_session.commit()
+            except Exception:
+                await db_session.rollback()
+                raise
+            return results
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_chunk(index: int, chunk: Sequence[Any]) -> None:
+            async with semaphore:
+                async with async_session_factory() as chunk_session:
+                    results[index] = await apply(chunk_session, chunk)
+                    await chunk_session.commit()
+            await report(chunk)
+
+        outcomes = await asyncio.gather(
+            *(run_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return results
+
+    @classmethod
+    async def bulk_create(
+        cls,
+        db_session: AsyncSession,
+        items: list[dict[str, Any]],
+        use_copy: Optional[bool] = None,
+        chunk_size: int = COPY_CHUNK_SIZE,
+        returning: bool = False,
+        atomic: bool = True,
+        concurrency: int = 1,
+        progress: Optional[Callable[[dict[str, Any]], Any]] = None,
+    ) -> Optional[list[UUID]]:
         """
         Perform a bulk insert operation asynchronously.
 
+        Large batches (`COPY_THRESHOLD` rows or more, unless `use_copy` says otherwise) are
+        streamed with PostgreSQL's COPY FROM STDIN instead of binding every row of an
+        INSERT, which is an order of magnitude faster for catalog imports and backfills.
+        Batches that leave out a column whose Python-side default is a SQL expression
+        (e.g. `default=func.now()`) are always inserted with INSERT, which evaluates it.
+
         Args:
             db_session (AsyncSession): The asynchronous database session.
             items (List[Dict[str, Any]]): A list of dictionaries representing the data to insert.
+            use_copy (Optional[bool]): Force (True) or disable (False) the COPY path.
+            chunk_size (int): Rows inserted per chunk.
+            returning (bool): Return the ids of the inserted rows.
+            atomic (bool): Commit once at the end (True) or after every chunk (False).
+            concurrency (int): Number of chunks inserted at the same time.
+            progress (Optional[Callable]): Called with the progress after every chunk.
+
+        Returns:
+            Optional[List[UUID]]: The inserted ids when `returning` is set.
+        """
+        if use_copy is None:
+            use_copy = len(items) >= COPY_THRESHOLD
+        if use_copy and cls._sql_default_columns(items):
+            # COPY can't evaluate SQL expression defaults, let INSERT apply them
+            use_copy = False
+
+        async def insert_chunk(session: AsyncSession, chunk: list[dict[str, Any]]):
+            if use_copy:
+                # COPY bypasses the ORM, record the new rows for cache invalidation
+                track_cache_writes(
+                    session.sync_session,
+                    cls,
+                    [item["id"] for item in chunk if item.get("id") is not None],
+                )
+                return await cls._copy_records(session, chunk, returning)
+            if returning:
+                result = await session.execute(insert(cls).returning(cls.id), chunk)
+                return list(result.scalars().all())
+            await session.execute(insert(cls), chunk)
+
+        results = await cls._run_chunked(
+            db_session, items, chunk_size, insert_chunk, atomic, concurrency, progress
+        )
+        if not returning:
+            return None
+        return [_id for ids in results for _id in ids]
+
+    @classmethod
+    def _sql_default_columns(cls, items: list[dict[str, Any]]) -> list:
+        """
+        Returns the columns some item leaves out whose Python-side default can't be
+        computed here (a SQL expression or a sequence).
+        """
+        return [
+            column
+            for column in cls.__table__.columns
+            if column.default is not None
+            and not (column.default.is_scalar or column.default.is_callable)
+            and any(column.key not in item for item in items)
+        ]
+
+    @classmethod
+    def _copy_columns(cls, items: list[dict[str, Any]]) -> list:
+        """
+        Maps the item keys to table columns, in table order.
+
+        Columns no item provides are left out so that their server defaults apply,
+        except those with a scalar or callable Python-side default, which COPY would
+        otherwise skip.
         """
-        async with db_session as session:
-            await session.execute(insert(cls), items)
-            await session.commit()
+        keys = set().union(*items)
+        return [
+            column
+            for column in cls.__table__.columns
+            if column.key in keys
+            or (
+                column.default is not None
+                and (column.default.is_scalar or column.default.is_callable)
+                and column.server_default is None
+            )
+        ]
+
+    @staticmethod
+    def _copy_value(column, item: dict[str, Any]) -> Any:
+        if column.key in item:
+            value = item[column.key]
+        elif column.default is None:
+            value = None
+        elif column.default.is_callable:
+            value = column.default.arg(None)
+        elif column.default.is_scalar:
+            value = column.default.arg
+        else:
+            value = None
+        # SQLAlchemy stores Enum members by name
+        return value.name if isinstance(value, Enum) else value
+
+    @classmethod
+    async def _copy_records(
+        cls,
+        db_session: AsyncSession,
+        items: list[dict[str, Any]],
+        returning: bool,
+    ) -> Optional[list[UUID]]:
+        """
+        Inserts one chunk of `items` with asyncpg's `copy_records_to_table`,
+        on the session's own connection and inside its transaction.
+
+        With `returning`, the chunk is first copied into a temporary staging table
+        and moved over with `INSERT ... SELECT ... RETURNING id`, since COPY itself
+        can't return generated values.
+        """
+        table = cls.__table__
+        columns = cls._copy_columns(items)
+        column_names = [column.name for column in columns]
+
+        # Open the transaction on the driver connection so that COPY joins it
+        await db_session.execute(select(1))
+        if returning:
+            staging = f"_bulk_create_{table.name}"
+            await db_session.execute(
+                text(
+                    f'CREATE TEMP TABLE IF NOT EXISTS "{staging}" '
+                    f"(LIKE {table.fullname} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            )
+        connection = await db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        records = [
+            tuple(cls._copy_value(column, item) for column in columns) for item in items
+        ]
+        if not returning:
+            await driver_connection.copy_records_to_table(
+                table.name,
+                records=records,
+                columns=column_names,
+                schema_name=table.schema,
+            )
+            return None
+
+        quoted = ", ".join(f'"{name}"' for name in column_names)
+        await driver_connection.copy_records_to_table(
+            staging, records=records, columns=column_names
+        )
+        result = await db_session.execute(
+            text(
+                f"INSERT INTO {table.fullname} ({quoted}) "
+                f'SELECT {quoted} FROM "{staging}" RETURNING id'
+            )
+        )
+        ids = list(result.scalars().all())
+        await db_session.execute(text(f'TRUNCATE "{staging}"'))
+        return ids
 
     @classmethod
-    async def bulk_update(cls, db_session: AsyncSession, items: list[dict[str, Any]]):
+    async def bulk_update(
+        cls,
+        db_session: AsyncSession,
+        items: list[dict[str, Any]],
+        chunk_size: int = UPDATE_CHUNK_SIZE,
+        atomic: bool = True,
+        concurrency: int = 1,
+        progress: Optional[Callable[[dict[str, Any]], Any]] = None,
+    ):
         """
         Perform a bulk update operation asynchronously.
 
+        Within each chunk, items are grouped by the set of columns they change, and each
+        group is applied with one `UPDATE ... FROM (VALUES ...)` statement instead of one
+        UPDATE per row. Instances already loaded in the session are not refreshed.
+        Items updating the same id are merged first, later values winning, as if
+        they had been applied one after the other.
+
         Args:
             db_session (AsyncSession): The asynchronous database session.
             items (List[Dict[str, Any]]): A list of dictionaries representing the data to update.
                 Each dictionary must contain the 'id' of the record to update.
+            chunk_size (int): Maximum number of rows per chunk.
+            atomic (bool): Commit once at the end (True) or after every chunk (False).
+            concurrency (int): Number of chunks updated at the same time.
+            progress (Optional[Callable]): Called with the progress after every chunk.
         """
-        async with db_session as session:
-            for item in items:
-                await session.execute(
-                    update(cls)
-                    .where(cls.id == item["id"])
-                    .values(**{k: v for k, v in item.items() if k != "id"})
-                )
-            await session.commit()
+
+        async def update_chunk(session: AsyncSession, chunk: list[dict[str, Any]]):
+            groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+            for item in chunk:
+                changed = tuple(sorted(key for key in item if key != "id"))
+                if changed:
+                    groups.setdefault(changed, []).append(item)
+            for changed, group in groups.items():
+                await session.execute(cls._values_update(changed, group))
+
+        # A VALUES join can't order two rows updating the same id, so the last item
+        # per id wins. This also keeps chunks independent of each other.
+        merged_items: dict[Any, dict[str, Any]] = {}
+        for item in items:
+            merged_items.setdefault(item["id"], {}).update(item)
+
+        await cls._run_chunked(
+            db_session,
+            list(merged_items.values()),
+            chunk_size,
+            update_chunk,
+            atomic,
+            concurrency,
+            progress,
+        )
+
+    @classmethod
+    def _values_update(cls, changed: tuple[str, ...], items: list[dict[str, Any]]):
+        """
+        Builds `UPDATE <table> SET col = data.col ... FROM (VALUES ...) AS data WHERE <table>.id = data.id`.
+        """
+        table_columns = cls.__table__.c
+        data = values(
+            values_column("id", table_columns["id"].type),
+            *(values_column(key, table_columns[key].type) for key in changed),
+            name="data",
+        ).data([(item["id"], *(item[key] for key in changed)) for item in items])
+        return (
+            update(cls)
+            .where(cls.id == data.c.id)
+            .values({key: data.c[key] for key in changed})
+            .execution_options(
+                synchronize_session=False,
+                invalidates_cache=[item["id"] for item in items],
+            )
+        )
 
     @classmethod
-    async def bulk_delete(cls, db_session: AsyncSession, ids: list[UUID]):
+    async def bulk_delete(
+        cls,
+        db_session: AsyncSession,
+        ids: list[UUID],
+        chunk_size: int = DELETE_CHUNK_SIZE,
+        atomic: bool = True,
+        concurrency: int = 1,
+        progress: Optional[Callable[[dict[str, Any]], Any]] = None,
+    ):
         """
         Perform a bulk hard delete operation asynchronously.
 
         Args:
             db_session (AsyncSession): The asynchronous database session.
             ids (List[UUID]): A list of IDs to delete.
+            chunk_size (int): Maximum number of ids per DELETE statement.
+            atomic (bool): Commit once at the end (True) or after every chunk (False).
+            concurrency (int): Number of chunks deleted at the same time.
+            progress (Optional[Callable]): Called with the progress after every chunk.
         """
-        async with db_session as session:
-            await session.execute(delete(cls).where(cls.id.in_(ids)))
-            await session.commit()
+
+        async def delete_chunk(session: AsyncSession, chunk: list[UUID]):
+            await session.execute(
+                delete(cls)
+                .where(cls.id.in_(chunk))
+                .execution_options(invalidates_cache=chunk)
+            )
+
+        await cls._run_chunked(
+            db_session, ids, chunk_size, delete_chunk, atomic, concurrency, progress
+        )
 
     @classmethod
-    async def bulk_soft_delete(cls, db_session: AsyncSession, ids: list[UUID]):
+    async def bulk_soft_delete(
+        cls,
+        db_session: AsyncSession,
+        ids: list[UUID],
+        chunk_size: int = DELETE_CHUNK_SIZE,
+        atomic: bool = True,
+        concurrency: int = 1,
+        progress: Optional[Callable[[dict[str, Any]], Any]] = None,
+    ):
         """
         Perform a bulk soft delete operation asynchronously.
 
         Args:
             db_session (AsyncSession): The asynchronous database session.
             ids (List[UUID]): A list of IDs to soft delete.
+            chunk_size (int): Maximum number of ids per UPDATE statement.
+            atomic (bool): Commit once at the end (True) or after every chunk (False).
+            concurrency (int): Number of chunks soft deleted at the same time.
+            progress (Optional[Callable]): Called with the progress after every chunk.
         """
-        async with db_session as session:
+
+        async def soft_delete_chunk(session: AsyncSession, chunk: list[UUID]):
             await session.execute(
-                update(cls).where(cls.id.in_(ids)).values(deleted_at=func.now())
+                update(cls)
+                .where(cls.id.in_(chunk))
+                .values(deleted_at=func.now())
+                .execution_options(invalidates_cache=chunk)
             )
-            await session.commit()
+
+        await cls._run_chunked(
+            db_session,
+            ids,
+            chunk_size,
+            soft_delete_chunk,
+            atomic,
+            concurrency,
+            progress,
+        )
 
     @classmethod
     async def bulk_upsert(
@@ -82,53 +475,138 @@ class BulkActionsMixin(metaclass=DeclarativeMeta):
         db_session: AsyncSession,
         items: list[dict[str, Any]],
         unique_constraint: Optional[tuple[str, ...]] = None,
-    ):
+        merge_rules: Optional[dict[str, Union[str, Callable]]] = None,
+        chunk_size: int = UPSERT_CHUNK_SIZE,
+        return_counts: bool = False,
+        atomic: bool = True,
+        concurrency: int = 1,
+        progress: Optional[Callable[[dict[str, Any]], Any]] = None,
+    ) -> Optional[dict[str, int]]:
         """
         Perform a bulk upsert operation (insert or update) asynchronously.
 
+        Built on PostgreSQL's `INSERT ... ON CONFLICT (...) DO UPDATE`, so each chunk is a
+        single atomic statement instead of a SELECT plus an INSERT or UPDATE per item,
+        and concurrent upserts of the same keys can't race each other.
+
         Args:
             db_session (AsyncSession): The asynchronous database session.
             items (List[Dict[str, Any]]): A list of dictionaries representing the data to upsert.
             unique_constraint (Optional[Tuple[str, ...]]): The unique constraint
                 to use for determining whether to insert or update. If None, the primary key is used.
+                The columns must be covered by a unique index or constraint, as ON CONFLICT requires.
+            merge_rules (Optional[Dict[str, Union[str, Callable]]]): How each column of an
+                existing row is merged with the incoming value. Columns without a rule are
+                overwritten ("replace"). Available rules:
+                    - "replace": take the incoming value.
+                    - "keep": keep the existing value.
+                    - "coalesce": take the incoming value unless it is NULL.
+                    - "add": add the incoming value to the existing one (e.g. stock counters).
+                    - "greatest" / "least": keep the larger / smaller of both.
+                    - a callable `(existing_column, incoming_column) -> SQL expression`.
+            chunk_size (int): Maximum number of rows per chunk.
+            return_counts (bool): Return how many rows were inserted and how many updated.
+            atomic (bool): Commit once at the end (True) or after every chunk (False).
+            concurrency (int): Number of chunks upserted at the same time.
+            progress (Optional[Callable]): Called with the progress after every chunk.
+
+        Returns:
+            Optional[Dict[str, int]]: `{"inserted": ..., "updated": ...}` when `return_counts` is set.
         """
-        async with db_session as session:
-            for item in items:
-                if unique_constraint:
-                    # Use unique constraint for checking existing records
-                    filter_condition = and_(
-                        *[getattr(cls, col) == item[col] for col in unique_constraint]
+        conflict_target = list(unique_constraint or ("id",))
+
+        # A statement can't touch the same row twice, so the last item per key wins.
+        # This also keeps chunks independent of each other.
+        unique_items = {}
+        for item in items:
+            key = tuple(item.get(column) for column in conflict_target)
+            unique_items[key if None not in key else id(item)] = item
+
+        async def upsert_chunk(session: AsyncSession, chunk: list[dict[str, Any]]):
+            counts = {"inserted": 0, "updated": 0}
+            # A multi-row INSERT needs the same columns in every row
+            groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+            for item in chunk:
+                groups.setdefault(tuple(sorted(item)), []).append(item)
+
+            for keys, group in groups.items():
+                # Stay under PostgreSQL's 32767 bind parameters per statement
+                rows_per_statement = max(1, 32767 // len(keys))
+                for start in range(0, len(group), rows_per_statement):
+                    statement = cls._upsert_statement(
+                        group[start : start + rows_per_statement],
+                        keys,
+                        conflict_target,
+                        merge_rules or {},
+                    )
+                    rows = (await session.execute(statement)).all()
+                    # Invalidate exactly the rows written, rather than the whole model
+                    track_cache_writes(
+                        session.sync_session, cls, [_id for _id, _ in rows]
                     )
-                else:
-                    # Use primary key for checking existing records
-                    filter_condition = cls.id == item.get("id")
+                    for _, inserted in rows:
+                        counts["inserted" if inserted else "updated"] += 1
+            return counts
 
-                existing_record = await session.execute(
-                    select(cls).where(filter_condition)
-                )
-                existing_record = existing_record.scalars().first()
-
-                if existing_record:
-                    # Update the existing record
-                    if unique_constraint:
-                        await session.execute(
-                            update(cls)
-                            .where(filter_condition)
-                            .values(
-                                **{
-                                    k: v
-                                    for k, v in item.items()
-                                    if k not in unique_constraint
-                                }
-                            )
-                        )
-                    else:
-                        await session.execute(
-                            update(cls)
-                            .where(cls.id == item["id"])
-                            .values(**{k: v for k, v in item.items() if k != "id"})
-                        )
-                else:
-                    # Insert a new record
-                    await session.execute(insert(cls).values(**item))
-            await session.commit()
+        results = await cls._run_chunked(
+            db_session,
+            list(unique_items.values()),
+            chunk_size,
+            upsert_chunk,
+            atomic,
+            concurrency,
+            progress,
+        )
+        if not return_counts:
+            return None
+        return {
+            "inserted": sum(counts["inserted"] for counts in results),
+            "updated": sum(counts["updated"] for counts in results),
+        }
+
+    @classmethod
+    def _upsert_statement(
+        cls,
+        items: list[dict[str, Any]],
+        keys: tuple[str, ...],
+        conflict_target: list[str],
+        merge_rules: dict[str, Union[str, Callable]],
+    ):
+        """
+        Builds the `INSERT ... ON CONFLICT` statement for one chunk of uniform items.
+
+        It returns the id of every row inserted or updated, and whether it was
+        inserted, so that the caller can invalidate their cache entries and count them.
+        """
+        statement = pg_insert(cls).values(items)
+        excluded = statement.excluded
+        table_columns = cls.__table__.c
+
+        merge_functions = {
+            "replace": lambda existing, incoming: incoming,
+            "coalesce": lambda existing, incoming: func.coalesce(incoming, existing),
+            "add": lambda existing, incoming: existing + incoming,
+            "greatest": lambda existing, incoming: func.greatest(existing, incoming),
+            "least": lambda existing, incoming: func.least(existing, incoming),
+        }
+        set_ = {}
+        for key in keys:
+            rule = merge_rules.get(key, "replace")
+            if key in conflict_target or rule == "keep":
+                continue
+            merge = rule if callable(rule) else merge_functions[rule]
+            set_[key] = merge(table_columns[key], excluded[key])
+
+        if not set_:
+            statement = statement.on_conflict_do_nothing(index_elements=conflict_target)
+        else:
+            if "updated_at" in table_columns and "updated_at" not in set_:
+                set_["updated_at"] = func.now()
+            statement = statement.on_conflict_do_update(
+                index_elements=conflict_target, set_=set_
+            )
+        # xmax is 0 only for freshly inserted row versions. The written ids are
+        # tracked for cache invalidation from what the statement returns.
+        return statement.returning(
+            cls.id, literal_column("xmax = 0").label("inserted")
+        ).execution_options(invalidates_cache=())
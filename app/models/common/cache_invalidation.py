@@ -0,0 +1,161 @@
+"""
+Write-through cache invalidation.
+
+Every session records which cached rows its transaction touched:
+
+- instances inserted, updated or deleted through the unit of work (flushes);
+- rows changed by UPDATE, DELETE or upsert statements run through the session. Such
+  statements name the ids they touch with the `invalidates_cache` execution option
+  (a list of ids, or True for "possibly any row"). UPDATE and DELETE statements without
+  it invalidate the whole model. INSERT statements without it invalidate the ids they
+  insert (dropping their "not found" entries) and the model's cached queries.
+
+Once the transaction commits, the entries of all touched rows are deleted from Redis
+in one pipeline (and from every worker's L1 cache), along with the cached query results
+of their models, and models touched as a whole get their generation bumped. Rolled back
+transactions invalidate nothing. Invalidations that fail, e.g. while Redis is
+unavailable, are retried along with the next one.
+
+Only entries cached without `extra_params` are deleted by id.
+"""
+import json
+import asyncio
+import logging
+from itertools import chain
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session, ORMExecuteState
+
+from .cache_model import CachingMixin, CACHE_INVALIDATION_CHANNEL
+
+
+logger = logging.getLogger(__name__)
+
+# Writes whose invalidation failed, retried with the next invalidation
+_unapplied_writes: dict[type, Optional[set]] = {}
+
+
+def _merge_writes(target: dict[type, Optional[set]], writes: dict) -> None:
+    """Adds `writes` to `target`, a model changed as a whole (None) absorbing its ids."""
+    for model, ids in writes.items():
+        if ids is None or target.get(model, set()) is None:
+            target[model] = None
+        else:
+            target.setdefault(model, set()).update(ids)
+
+
+def track_cache_writes(session: Session, model: type, ids=None) -> None:
+    """
+    Records that the current transaction of `session` changed rows of `model`.
+
+    Args:
+        session (Session): The (sync) session running the transaction.
+        model (type): The model whose rows changed, ignored unless it is cached.
+        ids (Optional[Iterable[UUID]]): The ids of the changed rows, None for any row.
+    """
+    if not (isinstance(model, type) and issubclass(model, CachingMixin)):
+        return
+    _merge_writes(session.info.setdefault("cache_writes", {}), {model: ids})
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_instances(session: Session, flush_context) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, CachingMixin) and instance.id is not None:
+            track_cache_writes(session, type(instance), [instance.id])
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statements(orm_execute_state: ORMExecuteState) -> None:
+    if not (
+        orm_execute_state.is_update
+        or orm_execute_state.is_delete
+        or orm_execute_state.is_insert
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    ids = orm_execute_state.execution_options.get("invalidates_cache")
+    if ids is None and orm_execute_state.is_insert:
+        # New rows change which rows queries return, and replace the "not found"
+        # entries of ids given explicitly
+        parameters = orm_execute_state.parameters or ()
+        if isinstance(parameters, dict):
+            parameters = [parameters]
+        ids = [row["id"] for row in parameters if row.get("id") is not None]
+    if ids is None or ids is True:
+        track_cache_writes(orm_execute_state.session, mapper.class_)
+    else:
+        track_cache_writes(orm_execute_state.session, mapper.class_, ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    writes = session.info.pop("cache_writes", None)
+    if not writes:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("Cache not invalidated, the session isn't used from an event loop")
+        return
+    task = loop.create_task(invalidate_cache_writes(writes))
+    pending = session.info.setdefault("cache_invalidations", set())
+    pending.add(task)
+    task.add_done_callback(pending.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_writes(session: Session) -> None:
+    session.info.pop("cache_writes", None)
+
+
+async def invalidate_cache_writes(writes: dict[type, Optional[set]]) -> None:
+    """
+    Invalidates the cache entries of the given rows: ids are deleted in a single
+    pipeline, models changed as a whole are invalidated by generation.
+    """
+    pending = {}
+    _merge_writes(pending, _unapplied_writes)
+    _unapplied_writes.clear()
+    _merge_writes(pending, writes)
+    try:
+        redis = await CachingMixin.get_redis()
+        messages = []
+        async with redis.pipeline(transaction=False) as pipe:
+            for model, ids in pending.items():
+                if ids is None:
+                    await model.invalidate_all_cache()
+                    continue
+                if ids:
+                    generation = await model._get_generation()
+                    keys = [
+                        model._generate_cache_key(_id, None, generation) for _id in ids
+                    ]
+                    pipe.delete(*keys)
+                    if model.local_cache_size > 0:
+                        messages.append({"model": model.__name__, "keys": keys})
+                # Cached query results may include or exclude any of these rows
+                query_tag = f"{model.__name__}:queries"
+                pipe.incr(f"gen:{query_tag}")
+                messages.append({"tag": query_tag})
+            for message in messages:
+                pipe.publish(CACHE_INVALIDATION_CHANNEL, json.dumps(message))
+            await pipe.execute()
+        for message in messages:
+            CachingMixin._apply_invalidation(message)
+    except Exception as e:
+        logger.warning("Cache invalidation after commit failed, will be retried: %s", e)
+        _merge_writes(_unapplied_writes, pending)
+
+
+async def wait_for_cache_invalidations(session) -> None:
+    """
+    Waits until the cache invalidations scheduled by the commits of `session`
+    (an `AsyncSession` or `Session`) are done, e.g. before answering a request.
+    """
+    session = getattr(session, "sync_session", session)
+    pending = session.info.get("cache_invalidations")
+    if pending:
+        await asyncio.gather(*pending)
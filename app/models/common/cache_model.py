@@ -1,16 +1,101 @@
 import os
 import json
-import pickle
+import math
+import time
+import uuid
+import random
+import zlib
+import struct
+import asyncio
 import hashlib
-from typing import Any, Optional
-from redis.asyncio import Redis
+import logging
+from typing import Any, Awaitable, Callable, Optional
+import msgpack
+from redis.exceptions import RedisError
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.session import async_session_factory
+from .local_cache import LocalCache
+from .cache_redis import cache_metrics, get_pubsub_client, get_redis_client
+from .cache_serializer import CacheSerializer, MsgpackSerializer
 
-# Get Redis credentials
-redis_credentials = json.loads(os.environ["REDISCRED"])
+
+logger = logging.getLogger(__name__)
+
+# Channel on which invalidations are broadcast to the L1 caches of every worker
+CACHE_INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Stampede protection: how long a worker may hold the lease on loading a missing
+# entry, how often the others check for its result, and how eagerly hot entries
+# are refreshed before they expire (0 disables early refreshes)
+CACHE_LOCK_TIMEOUT = float(os.getenv("CACHE_LOCK_TIMEOUT", default=5))
+CACHE_LOCK_POLL_INTERVAL = float(os.getenv("CACHE_LOCK_POLL_INTERVAL", default=0.05))
+CACHE_EARLY_REFRESH_BETA = float(os.getenv("CACHE_EARLY_REFRESH_BETA", default=1))
+
+# Lifetime of "not found" entries and of cached query results (ids of the matching rows)
+CACHE_NEGATIVE_TTL = int(os.getenv("CACHE_NEGATIVE_TTL", default=60))
+CACHE_QUERY_TTL = int(os.getenv("CACHE_QUERY_TTL", default=60))
+
+# Payloads of at least this many bytes are stored zlib-compressed (0 disables), and how hard
+CACHE_COMPRESS_THRESHOLD = int(os.getenv("CACHE_COMPRESS_THRESHOLD", default=512))
+CACHE_COMPRESS_LEVEL = int(os.getenv("CACHE_COMPRESS_LEVEL", default=6))
+
+# How long a worker trusts its copy of a generation counter without hearing about changes
+CACHE_GENERATION_TTL = float(os.getenv("CACHE_GENERATION_TTL", default=5))
+
+# Cache entries start with their expiry (epoch seconds) and how long they took to load.
+# An entry without payload records that the row doesn't exist, otherwise the payload starts
+# with a byte telling whether it's compressed.
+_ENTRY_HEADER = struct.Struct(">df")
+_NOT_FOUND = object()
+_UNCOMPRESSED = b"\x00"
+_ZLIB_COMPRESSED = b"\x01"
+
+# Deletes a lock only while it's still held with our token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# L1 caches of this process by model name, and the task keeping them in sync
+_local_caches: dict[str, LocalCache] = {}
+_invalidation_listener: Optional[asyncio.Task] = None
+
+# Generation counters of models and tags, as last seen by this process, and the
+# last known value of each, used while Redis can't be asked for the current one
+_generations = LocalCache(maxsize=10_000, ttl=CACHE_GENERATION_TTL)
+_last_generations: dict[str, int] = {}
+
+# Loads in progress in this process by cache key, and early refreshes running in the background
+_inflight: dict[str, asyncio.Future] = {}
+_refresh_tasks: dict[str, asyncio.Task] = {}
+
+
+def _pack_entry(payload: bytes, ttl: int, load_time: float) -> bytes:
+    return _ENTRY_HEADER.pack(time.time() + ttl, load_time) + payload
+
+
+def _unpack_entry(entry: bytes) -> tuple[bytes, float, float]:
+    """Returns the payload, expiry and load time of a cache entry."""
+    expires_at, load_time = _ENTRY_HEADER.unpack_from(entry)
+    return entry[_ENTRY_HEADER.size :], expires_at, load_time
+
+
+def _should_refresh_early(expires_at: float, load_time: float) -> bool:
+    """
+    Probabilistic early expiration ("XFetch"): the closer an entry is to expiring, and
+    the longer it takes to load, the likelier a read is to refresh it ahead of time.
+    Popular entries are thus refreshed by a single reader before they expire,
+    instead of by every reader at once after.
+    """
+    if CACHE_EARLY_REFRESH_BETA <= 0:
+        return False
+    jitter = -load_time * CACHE_EARLY_REFRESH_BETA * math.log(1 - random.random())
+    return time.time() + jitter >= expires_at
 
 
 class CachingMixin(metaclass=DeclarativeMeta):
@@ -18,42 +103,196 @@ class CachingMixin(metaclass=DeclarativeMeta):
     Enhanced mixin for caching data using Redis, featuring:
 
     - Personalized hash key generation specific to Wardrobers' data models.
-    - Robust serialization with pickle for complex data structures.
-    - Optimized Redis interaction using aioredis for asynchronous operations.
+    - Compact, schema-versioned serialization of column values (msgpack by default,
+      pluggable per model through `cache_serializer`).
+    - Optimized Redis interaction using aioredis for asynchronous operations, over a
+      connection pool shared by all models, with per-command timeouts.
+    - Graceful degradation: while Redis fails or is too slow, a circuit breaker skips it
+      and lookups are answered by the L1 cache or the database.
     - Configurable cache expiry (TTL).
-    - Cache invalidation methods.
+    - Stampede protection: concurrent misses are coalesced within a process, a Redis
+      lease lets a single worker load a missing entry, and hot entries are refreshed
+      in the background shortly before they expire.
+    - Batched lookups: one MGET, one database query for the misses, one pipelined write-back.
+    - Transparent zlib compression of large payloads, tunable per model through
+      `cache_compress_threshold` and `cache_compress_level`.
+    - Negative caching: missing ids are remembered for `CACHE_NEGATIVE_TTL` seconds.
+    - Query-result caching (`cached_filter`, `cached_paginate`, `cached_search`): the ids
+      matching a query are cached and resolved through the per-id cache. Any write to the
+      model invalidates them.
+    - Optional per-process L1 cache in front of Redis for hot, rarely changing rows.
+    - Cache invalidation methods, propagated to every worker's L1 cache via pub/sub.
+    - Generation-based invalidation: keys embed generation counters of the model and of
+      the tags it declares in `cache_tags`, so invalidating a whole model or tag is a
+      single INCR and old entries simply age out.
+
+    The L1 cache is off by default. Models turn it on by setting `local_cache_size`
+    (maximum number of entries kept per process) and optionally `local_cache_ttl`,
+    which also bounds how stale an entry can get if an invalidation message is lost.
     """
 
-    _redis = None
+    local_cache_size: int = 0
+    local_cache_ttl: float = 60
+
+    cache_serializer: CacheSerializer = MsgpackSerializer()
+
+    # Serialized instances of at least this many bytes are compressed (0 disables)
+    cache_compress_threshold: int = CACHE_COMPRESS_THRESHOLD
+    cache_compress_level: int = CACHE_COMPRESS_LEVEL
+
+    # Tags of related entities this model's entries depend on, e.g. ("Products",)
+    # for variants, so that `invalidate_tag("Products")` drops them as well
+    cache_tags: tuple[str, ...] = ()
 
     @classmethod
     async def get_redis(cls):
-        """Get or create a Redis client."""
-        if cls._redis is None:
-            cls._redis = Redis(
-                host=redis_credentials["host"],
-                port=redis_credentials["port"],
-                password=redis_credentials["password"],
-                decode_responses=True,
+        """Get the shared Redis client, guarded by the cache circuit breaker."""
+        return get_redis_client()
+
+    @classmethod
+    async def get_pubsub_redis(cls):
+        """Get the Redis client used to subscribe to invalidations."""
+        return get_pubsub_client()
+
+    @classmethod
+    def _get_local_cache(cls) -> Optional[LocalCache]:
+        """
+        Returns the model's L1 cache, or None if it isn't enabled.
+        """
+        if cls.local_cache_size <= 0:
+            return None
+        cache = _local_caches.get(cls.__name__)
+        if cache is None:
+            cache = LocalCache(cls.local_cache_size, cls.local_cache_ttl)
+            _local_caches[cls.__name__] = cache
+        cls._ensure_invalidation_listener()
+        return cache
+
+    @classmethod
+    def _ensure_invalidation_listener(cls):
+        """
+        Starts the pub/sub listener applying invalidations published by other workers,
+        once per process, as soon as anything is cached locally.
+        """
+        global _invalidation_listener
+        if _invalidation_listener is None or _invalidation_listener.done():
+            _invalidation_listener = asyncio.ensure_future(
+                cls._listen_for_invalidations()
             )
-        return cls._redis
+
+    @classmethod
+    async def _listen_for_invalidations(cls):
+        """
+        Applies invalidation messages to this process until cancelled.
+
+        Messages may have been missed while the subscription was down, so every
+        L1 cache and generation counter is dropped once resubscribed. Until then,
+        L1 caches keep serving their entries.
+        """
+        resubscribing = False
+        while True:
+            try:
+                redis = await cls.get_pubsub_redis()
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                    if resubscribing:
+                        for cache in _local_caches.values():
+                            cache.clear()
+                        _generations.clear()
+                        resubscribing = False
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            cls._apply_invalidation(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation listener failed: %s", e)
+                resubscribing = True
+                await asyncio.sleep(1)
+
+    @staticmethod
+    def _apply_invalidation(message: dict[str, Any]):
+        if "tag" in message:
+            current = _generations.get(message["tag"])
+            if message.get("generation") is None:
+                # Bumped without telling the new value: read it again on next use
+                _generations.delete(message["tag"])
+                _last_generations.pop(message["tag"], None)
+            elif current is None or message["generation"] > current:
+                _generations.set(message["tag"], message["generation"])
+                _last_generations[message["tag"]] = message["generation"]
+            # Entries of the old generation are unreachable, free them up
+            cache = _local_caches.get(message["tag"])
+            if cache is not None:
+                cache.clear()
+            return
+
+        cache = _local_caches.get(message["model"])
+        if cache is None:
+            return
+        if message.get("keys") is None:
+            cache.clear()
+            return
+        for key in message["keys"]:
+            cache.delete(key)
+
+    @classmethod
+    async def _publish_invalidation(cls, keys: Optional[list[str]] = None):
+        """Evicts `keys` (or everything, if None) from the model's L1 cache on every worker."""
+        message = {"model": cls.__name__, "keys": keys}
+        cls._apply_invalidation(message)
+        if cls.local_cache_size > 0:
+            redis = await cls.get_redis()
+            await redis.publish(CACHE_INVALIDATION_CHANNEL, json.dumps(message))
+
+    @classmethod
+    async def _get_generation(cls, *extra_tags: str) -> str:
+        """
+        Returns the current generations of the model, its `cache_tags` and `extra_tags`,
+        e.g. '3.1'.
+
+        Counters are read from Redis at most every `CACHE_GENERATION_TTL` seconds
+        and otherwise kept up to date by invalidation messages. While Redis can't
+        be read, the last known counters are used, so that L1 caches keep serving.
+
+        Raises:
+            RedisError: If Redis can't be read and a counter was never seen.
+        """
+        cls._ensure_invalidation_listener()
+        tags = (cls.__name__, *cls.cache_tags, *extra_tags)
+        missing = [tag for tag in tags if _generations.get(tag) is None]
+        if missing:
+            try:
+                redis = await cls.get_redis()
+                counters = await redis.mget([f"gen:{tag}" for tag in missing])
+            except RedisError:
+                if any(tag not in _last_generations for tag in tags):
+                    raise
+                return ".".join(str(_last_generations[tag]) for tag in tags)
+            for tag, counter in zip(missing, counters):
+                cls._apply_invalidation({"tag": tag, "generation": int(counter or 0)})
+        return ".".join(str(_generations.get(tag, 0)) for tag in tags)
 
     @classmethod
     def _generate_cache_key(
-        cls, _id: UUID, extra_params: Optional[dict[str, Any]] = None
+        cls,
+        _id: UUID,
+        extra_params: Optional[dict[str, Any]] = None,
+        generation: str = "0",
     ) -> str:
         """
-        Generates a personalized cache key incorporating model name, ID, and optional parameters.
+        Generates a personalized cache key incorporating model name, generation, ID,
+        and optional parameters.
 
-        Example: 'User:e9ab3302-9887-11ec-a439-02488537b83c:{"role": "admin"}'
+        Example: 'User:3:' + SHA256 of 'User:e9ab3302-9887-11ec-a439-02488537b83c:{"role": "admin"}'
         """
         base_key = f"{cls.__name__}:{str(_id)}"
         if extra_params:
             extra_str = json.dumps(extra_params, sort_keys=True)
             base_key += f":{extra_str}"
-        return hashlib.sha256(
-            base_key.encode()
-        ).hexdigest()  # Use SHA256 for robust hashing
+        # Use SHA256 for robust hashing
+        digest = hashlib.sha256(base_key.encode()).hexdigest()
+        return f"{cls.__name__}:{generation}:{digest}"
 
     @classmethod
     async def cached_get_by_id(
@@ -64,7 +303,7 @@ class CachingMixin(metaclass=DeclarativeMeta):
         extra_params: Optional[dict[str, Any]] = None,
     ):
         """
-        Retrieves an entry by ID, utilizing Redis caching.
+        Retrieves an entry by ID, utilizing the L1 cache (if enabled) and Redis caching.
 
         Args:
             db_session (AsyncSession): The async database session.
@@ -72,17 +311,452 @@ class CachingMixin(metaclass=DeclarativeMeta):
             ttl (int): Time-to-live for the cached data in seconds (default: 1 hour).
             extra_params (Optional[Dict[str, Any]]): Additional parameters to personalize the cache key.
         """
+        try:
+            generation = await cls._get_generation()
+            cache_key = cls._generate_cache_key(_id, extra_params, generation)
+            local_cache = cls._get_local_cache()
+            entry = local_cache.get(cache_key) if local_cache is not None else None
+            local_hit = entry is not None
+            if not local_hit:
+                redis = await cls.get_redis()
+                entry = await redis.get(cache_key)
+                if entry and local_cache is not None:
+                    local_cache.set(cache_key, entry, ttl)
+
+            if entry:
+                # None means the entry was written for another schema version
+                instance, expires_at, load_time = cls._decode_entry(entry)
+                if instance is not None:
+                    if local_hit:
+                        cache_metrics.local_hits += 1
+                    else:
+                        cache_metrics.hits += 1
+                    if instance is _NOT_FOUND:
+                        return None
+                    if _should_refresh_early(expires_at, load_time):
+                        cls._refresh_in_background(_id, cache_key, ttl)
+                    return instance
+
+            cache_metrics.misses += 1
+            return await cls._load_single_flight(db_session, _id, cache_key, ttl)
+        except RedisError as e:
+            logger.debug("Cache unavailable, loading %s %s: %s", cls.__name__, _id, e)
+            cache_metrics.fallbacks += 1
+            return await cls.get_by_id(db_session, _id)
+
+    @classmethod
+    def _decode_entry(cls, entry: bytes) -> tuple[Optional[Any], float, float]:
+        """
+        Returns the instance stored in a cache entry (`_NOT_FOUND` for a negative
+        entry, None for an unusable one), its expiry and load time.
+        """
+        if len(entry) < _ENTRY_HEADER.size:
+            return None, 0.0, 0.0
+        payload, expires_at, load_time = _unpack_entry(entry)
+        if not payload:
+            return _NOT_FOUND, expires_at, load_time
+        return cls._load_payload(payload), expires_at, load_time
+
+    @classmethod
+    def _dump_payload(cls, instance) -> bytes:
+        """
+        Serializes `instance` into a cache payload, compressed if it's at least
+        `cache_compress_threshold` bytes long and compression actually saves space.
+        """
+        payload = cls.cache_serializer.dumps(instance)
+        if 0 < cls.cache_compress_threshold <= len(payload):
+            compressed = zlib.compress(payload, cls.cache_compress_level)
+            if len(compressed) < len(payload):
+                cache_metrics.record_payload(cls.__name__, len(payload), len(compressed))
+                return _ZLIB_COMPRESSED + compressed
+        cache_metrics.record_payload(cls.__name__, len(payload), len(payload))
+        return _UNCOMPRESSED + payload
+
+    @classmethod
+    def _load_payload(cls, payload: bytes) -> Optional[Any]:
+        """Returns the instance stored in a cache payload, or None if it can't be used."""
+        header, data = payload[:1], payload[1:]
+        if header == _ZLIB_COMPRESSED:
+            try:
+                data = zlib.decompress(data)
+            except zlib.error:
+                return None
+        elif header != _UNCOMPRESSED:
+            return None
+        return cls.cache_serializer.loads(cls, data)
+
+    @classmethod
+    async def _load_single_flight(
+        cls, db_session: AsyncSession, _id: UUID, cache_key: str, ttl: int
+    ):
+        """
+        Loads a missing entry, making concurrent callers in this process wait for
+        the first one's result instead of each querying the database.
+        """
+        inflight = _inflight.get(cache_key)
+        if inflight is not None:
+            try:
+                entry = await asyncio.shield(inflight)
+            except Exception:
+                # The leading load failed, try on our own
+                return await cls.get_by_id(db_session, _id)
+            instance = cls._decode_entry(entry)[0] if entry else None
+            return None if instance is _NOT_FOUND else instance
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark a failure as retrieved, even if nobody was waiting for it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        _inflight[cache_key] = future
+        try:
+            instance, entry = await cls._fill(db_session, _id, cache_key, ttl)
+            if instance is not None and entry is None:
+                # Loaded without the lease and so not cached, but the waiters need it
+                entry = _pack_entry(cls._dump_payload(instance), ttl, 0.0)
+            future.set_result(entry)
+            return instance
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            if not future.done():
+                future.set_exception(RuntimeError("Cache load was cancelled"))
+            if _inflight.get(cache_key) is future:
+                del _inflight[cache_key]
+
+    @classmethod
+    async def _fill(
+        cls,
+        db_session: AsyncSession,
+        _id: UUID,
+        cache_key: str,
+        ttl: int,
+        wait: bool = True,
+    ) -> tuple[Optional[Any], Optional[bytes]]:
+        """
+        Loads `_id` from the database and caches it, under a Redis lease so that
+        only one worker at a time does so for the same key.
+
+        Workers that don't get the lease poll Redis for the holder's result (unless
+        `wait` is False), and only query the database themselves once the lease is
+        released without a result or expires.
+
+        Returns:
+            Tuple: The instance (or None) and the cache entry written for it, if any.
+        """
         redis = await cls.get_redis()
-        cache_key = cls._generate_cache_key(_id, extra_params)
-        data = await redis.get(cache_key)
+        lock_key = f"lock:{cache_key}"
+        token = uuid.uuid4().hex
+        leased = await redis.set(
+            lock_key, token, nx=True, px=int(CACHE_LOCK_TIMEOUT * 1000)
+        )
+        if not leased:
+            if not wait:
+                return None, None
+            deadline = time.monotonic() + CACHE_LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(CACHE_LOCK_POLL_INTERVAL)
+                entry, lock = await redis.mget([cache_key, lock_key])
+                if entry:
+                    instance = cls._decode_entry(entry)[0]
+                    if instance is _NOT_FOUND:
+                        return None, entry
+                    if instance is not None:
+                        return instance, entry
+                if lock is None:
+                    break
+            return await cls.get_by_id(db_session, _id), None
+
+        try:
+            started = time.perf_counter()
+            instance = await cls.get_by_id(db_session, _id)
+            if instance is None:
+                if CACHE_NEGATIVE_TTL <= 0:
+                    return None, None
+                ttl = CACHE_NEGATIVE_TTL
+                entry = _pack_entry(b"", ttl, 0.0)
+            else:
+                entry = _pack_entry(
+                    cls._dump_payload(instance),
+                    ttl,
+                    time.perf_counter() - started,
+                )
+            await redis.set(cache_key, entry, ex=ttl)
+            local_cache = cls._get_local_cache()
+            if local_cache is not None:
+                local_cache.set(cache_key, entry, ttl)
+            return instance, entry
+        finally:
+            await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+    @classmethod
+    def _refresh_in_background(cls, _id: UUID, cache_key: str, ttl: int):
+        """Reloads an entry that is about to expire, in its own session."""
+        if cache_key in _inflight or cache_key in _refresh_tasks:
+            return
+
+        async def refresh():
+            async with async_session_factory() as db_session:
+                await cls._fill(db_session, _id, cache_key, ttl, wait=False)
+
+        def done(task: asyncio.Task):
+            _refresh_tasks.pop(cache_key, None)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning("Early cache refresh failed: %s", task.exception())
+
+        task = asyncio.ensure_future(refresh())
+        _refresh_tasks[cache_key] = task
+        task.add_done_callback(done)
+
+    @classmethod
+    async def cached_get_by_ids(
+        cls,
+        db_session: AsyncSession,
+        ids: list[UUID],
+        ttl: int = 3600,
+        extra_params: Optional[dict[str, Any]] = None,
+    ) -> list:
+        """
+        Retrieves several entries by ID, utilizing the L1 cache (if enabled) and Redis caching.
+
+        Entries missing from the L1 cache are fetched with a single MGET, the remaining
+        misses with a single `get_by_ids` query, and those are written back to Redis
+        in one pipeline. If Redis is unavailable, the misses are loaded and not cached.
+
+        Args:
+            db_session (AsyncSession): The async database session.
+            ids (List[UUID]): The IDs of the objects to retrieve.
+            ttl (int): Time-to-live for the cached data in seconds (default: 1 hour).
+            extra_params (Optional[Dict[str, Any]]): Additional parameters to personalize the cache keys.
+
+        Returns:
+            List: The instances found, in the order of `ids`. Missing and soft deleted
+                IDs are left out.
+        """
+        ids = list(dict.fromkeys(uuid.UUID(str(_id)) for _id in ids))
+        # Instances by id, or `_NOT_FOUND` for ids known to be missing
+        found = {}
+        # Stays None if Redis is unavailable, the misses are then only loaded
+        redis = None
+
+        try:
+            generation = await cls._get_generation()
+            keys = {
+                _id: cls._generate_cache_key(_id, extra_params, generation)
+                for _id in ids
+            }
+
+            local_cache = cls._get_local_cache()
+            if local_cache is not None:
+                for _id, key in keys.items():
+                    entry = local_cache.get(key)
+                    instance = cls._decode_entry(entry)[0] if entry else None
+                    if instance is not None:
+                        found[_id] = instance
+                        cache_metrics.local_hits += 1
+
+            client = await cls.get_redis()
+            pending = [_id for _id in ids if _id not in found]
+            if pending:
+                cached = await client.mget([keys[_id] for _id in pending])
+                for _id, entry in zip(pending, cached):
+                    instance = cls._decode_entry(entry)[0] if entry else None
+                    if instance is not None:
+                        found[_id] = instance
+                        cache_metrics.hits += 1
+                        if local_cache is not None:
+                            local_cache.set(keys[_id], entry, ttl)
+            redis = client
+        except RedisError as e:
+            logger.debug("Cache unavailable, loading %s rows: %s", cls.__name__, e)
+
+        pending = [_id for _id in ids if _id not in found]
+        if pending:
+            if redis is None:
+                cache_metrics.fallbacks += len(pending)
+            else:
+                cache_metrics.misses += len(pending)
+            started = time.perf_counter()
+            instances = [
+                instance
+                for instance in await cls.get_by_ids(db_session, pending)
+                if instance.deleted_at is None
+            ]
+            load_time = time.perf_counter() - started
+            for instance in instances:
+                found[instance.id] = instance
+
+        if pending and redis is not None:
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for instance in instances:
+                        entry = _pack_entry(
+                            cls._dump_payload(instance), ttl, load_time
+                        )
+                        pipe.set(keys[instance.id], entry, ex=ttl)
+                        if local_cache is not None:
+                            local_cache.set(keys[instance.id], entry, ttl)
+                    if CACHE_NEGATIVE_TTL > 0:
+                        for _id in pending:
+                            if _id not in found:
+                                entry = _pack_entry(b"", CACHE_NEGATIVE_TTL, 0.0)
+                                pipe.set(keys[_id], entry, ex=CACHE_NEGATIVE_TTL)
+                    await pipe.execute()
+            except RedisError as e:
+                logger.debug("Caching %s rows failed: %s", cls.__name__, e)
+
+        return [
+            found[_id]
+            for _id in ids
+            if _id in found and found[_id] is not _NOT_FOUND
+        ]
+
+    @classmethod
+    async def cached_query(
+        cls,
+        db_session: AsyncSession,
+        query: dict[str, Any],
+        fetch: Callable[[], Awaitable[list]],
+        ttl: int = CACHE_QUERY_TTL,
+        item_ttl: int = 3600,
+    ) -> list:
+        """
+        Caches the ids of the instances returned by `fetch` under a key derived from
+        `query`, and resolves them through the per-id cache on later calls.
+
+        The key embeds a generation counter bumped by every write to the model,
+        so cached results never outlive a change to the rows they were built from.
+        Soft deleted rows are always left out, whether the results come from the
+        cache or not, so a page may hold fewer rows than were fetched.
+
+        Args:
+            db_session (AsyncSession): The async database session.
+            query (Dict[str, Any]): JSON-serializable description of the query and its
+                parameters, identifying the results.
+            fetch (Callable): Runs the query, returning model instances.
+            ttl (int): Time-to-live of the cached ids in seconds.
+            item_ttl (int): Time-to-live of the per-id entries in seconds.
+
+        Returns:
+            List: The matching instances that aren't soft deleted.
+        """
+        try:
+            generation = await cls._get_generation(f"{cls.__name__}:queries")
+            digest = hashlib.sha256(
+                json.dumps(query, sort_keys=True, default=str).encode()
+            ).hexdigest()
+            cache_key = f"{cls.__name__}:{generation}:query:{digest}"
+
+            redis = await cls.get_redis()
+            entry = await redis.get(cache_key)
+        except RedisError as e:
+            logger.debug("Cache unavailable, querying %s: %s", cls.__name__, e)
+            cache_metrics.fallbacks += 1
+            return [instance for instance in await fetch() if instance.deleted_at is None]
+
+        if entry and len(entry) >= _ENTRY_HEADER.size:
+            cache_metrics.hits += 1
+            ids = msgpack.unpackb(_unpack_entry(entry)[0])
+            ids = [uuid.UUID(bytes=_id) for _id in ids]
+            return await cls.cached_get_by_ids(db_session, ids, item_ttl)
 
-        if data:
-            return pickle.loads(data)  # Deserialize using pickle
+        cache_metrics.misses += 1
+        started = time.perf_counter()
+        instances = [
+            instance for instance in await fetch() if instance.deleted_at is None
+        ]
+        load_time = time.perf_counter() - started
 
-        instance = await cls.get_by_id(db_session, _id)
-        if instance:
-            await redis.set(cache_key, pickle.dumps(instance), expire=ttl)
-        return instance
+        # Cache the ids, and back-fill the per-id cache they will be resolved through
+        try:
+            item_generation = await cls._get_generation()
+            async with redis.pipeline(transaction=False) as pipe:
+                ids = msgpack.packb([instance.id.bytes for instance in instances])
+                pipe.set(cache_key, _pack_entry(ids, ttl, load_time), ex=ttl)
+                for instance in instances:
+                    pipe.set(
+                        cls._generate_cache_key(instance.id, None, item_generation),
+                        _pack_entry(cls._dump_payload(instance), item_ttl, load_time),
+                        ex=item_ttl,
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.debug("Caching %s query results failed: %s", cls.__name__, e)
+        return instances
+
+    @classmethod
+    async def cached_filter(
+        cls,
+        db_session: AsyncSession,
+        filters: Optional[dict[str, Any]] = None,
+        relationships: Optional[dict[str, tuple[str, Any]]] = None,
+        order_by: Optional[list[tuple[str, str]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        ttl: int = CACHE_QUERY_TTL,
+    ) -> list:
+        """
+        `BaseMixin.filter` with its results cached, see `cached_query`.
+
+        Results are keyed by the normalized query shape and its parameter values,
+        the same way `filter` reuses its compiled statements.
+        """
+        query = {
+            "filter": cls._query_shape(filters, relationships, order_by),
+            "params": cls._query_params(filters, relationships),
+            "limit": limit,
+            "offset": offset,
+        }
+        return await cls.cached_query(
+            db_session,
+            query,
+            lambda: cls.filter(
+                db_session, filters, relationships, order_by, limit, offset
+            ),
+            ttl,
+        )
+
+    @classmethod
+    async def cached_paginate(
+        cls,
+        db_session: AsyncSession,
+        page: int,
+        page_size: int,
+        filters: Optional[dict[str, Any]] = None,
+        relationships: Optional[dict[str, tuple[str, Any]]] = None,
+        order_by: Optional[list[tuple[str, str]]] = None,
+        ttl: int = CACHE_QUERY_TTL,
+    ) -> list:
+        """`BaseMixin.paginate` with its results cached, see `cached_query`."""
+        return await cls.cached_filter(
+            db_session,
+            filters=filters,
+            relationships=relationships,
+            order_by=order_by,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            ttl=ttl,
+        )
+
+    @classmethod
+    async def cached_search(
+        cls,
+        db_session: AsyncSession,
+        search_term: str,
+        ttl: int = CACHE_QUERY_TTL,
+        **search_options: Any,
+    ) -> list:
+        """
+        `SearchMixin.search` with its results cached, see `cached_query`.
+
+        Takes the same options as `search`, except `projection`.
+        """
+        query = {"search": search_term, **search_options}
+        return await cls.cached_query(
+            db_session,
+            query,
+            lambda: cls.search(db_session, search_term, **search_options),
+            ttl,
+        )
 
     @classmethod
     async def invalidate_cache_by_id(
@@ -90,13 +764,27 @@ class CachingMixin(metaclass=DeclarativeMeta):
     ):
         """Invalidate the cache for a specific ID and optional parameters."""
         redis = await cls.get_redis()
-        cache_key = cls._generate_cache_key(_id, extra_params)
+        generation = await cls._get_generation()
+        cache_key = cls._generate_cache_key(_id, extra_params, generation)
         await redis.delete(cache_key)
+        await cls._publish_invalidation([cache_key])
 
     @classmethod
     async def invalidate_all_cache(cls):
         """Invalidate all cache entries for this model."""
+        await cls.invalidate_tag(cls.__name__)
+
+    @classmethod
+    async def invalidate_tag(cls, tag: str):
+        """
+        Invalidate every cache entry of the model named `tag`, and of the models
+        listing it in their `cache_tags`, by bumping its generation counter.
+
+        No keys are scanned or deleted: entries of older generations are no longer
+        looked up and expire with their TTL.
+        """
         redis = await cls.get_redis()
-        pattern = f"{cls.__name__}:*"
-        async for key in redis.iscan(match=pattern):
-            await redis.delete(key)
+        generation = await redis.incr(f"gen:{tag}")
+        message = {"tag": tag, "generation": generation}
+        cls._apply_invalidation(message)
+        await redis.publish(CACHE_INVALIDATION_CHANNEL, json.dumps(message))
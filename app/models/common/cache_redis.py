@@ -0,0 +1,285 @@
+import os
+import json
+import time
+import logging
+from typing import Any, Callable, Optional
+from redis.asyncio import Redis, BlockingConnectionPool
+from redis.exceptions import ConnectionError, RedisError, TimeoutError
+
+
+logger = logging.getLogger(__name__)
+
+# Get Redis credentials
+redis_credentials = json.loads(os.environ["REDISCRED"])
+
+# Connection pool shared by every cached model, and how long a command may take:
+# waiting for a free connection, connecting, and reading each reply
+CACHE_REDIS_MAX_CONNECTIONS = int(os.getenv("CACHE_REDIS_MAX_CONNECTIONS", default=50))
+CACHE_REDIS_POOL_TIMEOUT = float(os.getenv("CACHE_REDIS_POOL_TIMEOUT", default=0.5))
+CACHE_REDIS_CONNECT_TIMEOUT = float(os.getenv("CACHE_REDIS_CONNECT_TIMEOUT", default=0.5))
+CACHE_REDIS_SOCKET_TIMEOUT = float(os.getenv("CACHE_REDIS_SOCKET_TIMEOUT", default=0.25))
+
+# Circuit breaker: consecutive failures after which Redis is skipped, and for how long
+CACHE_BREAKER_FAILURE_THRESHOLD = int(
+    os.getenv("CACHE_BREAKER_FAILURE_THRESHOLD", default=5)
+)
+CACHE_BREAKER_RESET_TIMEOUT = float(os.getenv("CACHE_BREAKER_RESET_TIMEOUT", default=30))
+
+
+class CacheUnavailableError(ConnectionError):
+    """Raised instead of sending a command while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops sending commands to Redis once it keeps failing.
+
+    The breaker opens after `failure_threshold` consecutive failures, and commands
+    then fail immediately with `CacheUnavailableError`. After `reset_timeout` seconds
+    a single trial command is let through: its success closes the breaker again,
+    its failure keeps it open for another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        """Returns whether a command may be sent now."""
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout:
+            return False
+        # A trial that never reported back (e.g. it was cancelled) doesn't block the next one
+        if (
+            self._trial_started_at is not None
+            and now - self._trial_started_at < self.reset_timeout
+        ):
+            return False
+        self._trial_started_at = now
+        return True
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info("Redis recovered, cache circuit breaker closed")
+        self.failures = 0
+        self.opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_started_at = None
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning(
+                    "Redis failed %d times in a row, cache circuit breaker opened",
+                    self.failures,
+                )
+            self.opened_at = time.monotonic()
+
+
+class CacheMetrics:
+    """
+    Counters describing how well the cache serves this process.
+
+    Hits and misses are counted per lookup (per id for batched lookups), `fallbacks`
+    counts lookups served by the database because Redis was unavailable. Command
+    latencies cover every Redis command and pipeline sent. Payload sizes before and
+    after compression are summed per model.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.local_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.fallbacks = 0
+        self.commands = 0
+        self.command_time = 0.0
+        self.max_command_time = 0.0
+        # Serialized and stored payload bytes by model
+        self.payload_bytes: dict[str, list[int]] = {}
+
+    def record_command(self, seconds: float):
+        self.commands += 1
+        self.command_time += seconds
+        self.max_command_time = max(self.max_command_time, seconds)
+
+    def record_payload(self, model: str, size: int, stored_size: int):
+        sizes = self.payload_bytes.setdefault(model, [0, 0])
+        sizes[0] += size
+        sizes[1] += stored_size
+
+    def snapshot(self) -> dict:
+        lookups = self.local_hits + self.hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (
+                round((self.local_hits + self.hits) / lookups, 4) if lookups else None
+            ),
+            "errors": self.errors,
+            "fallbacks": self.fallbacks,
+            "commands": self.commands,
+            "avg_command_ms": (
+                round(self.command_time / self.commands * 1000, 3)
+                if self.commands
+                else None
+            ),
+            "max_command_ms": round(self.max_command_time * 1000, 3),
+            "compression": {
+                model: {
+                    "bytes": size,
+                    "stored_bytes": stored_size,
+                    "ratio": round(size / stored_size, 2) if stored_size else None,
+                }
+                for model, (size, stored_size) in self.payload_bytes.items()
+            },
+        }
+
+
+class _GuardedPipeline:
+    """Pipeline whose `execute` goes through the client's circuit breaker."""
+
+    def __init__(self, redis: "ResilientRedis", pipeline):
+        self._redis = redis
+        self._pipeline = pipeline
+
+    async def __aenter__(self):
+        await self._pipeline.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self._pipeline.__aexit__(*exc_info)
+
+    def __getattr__(self, name: str):
+        return getattr(self._pipeline, name)
+
+    async def execute(self, raise_on_error: bool = True):
+        return await self._redis._execute(self._pipeline.execute, raise_on_error)
+
+
+class ResilientRedis:
+    """
+    Wraps a Redis client so that every command goes through the circuit breaker
+    and is timed into the cache metrics.
+
+    Commands raise `RedisError` (`CacheUnavailableError` while the breaker is open),
+    which callers treat as a cache miss and answer from the database.
+    """
+
+    # Attributes passed through as they are
+    _UNGUARDED = frozenset({"pubsub", "close", "aclose", "connection_pool"})
+
+    def __init__(self, client: Redis, breaker: CircuitBreaker, metrics: CacheMetrics):
+        self._client = client
+        self.breaker = breaker
+        self.metrics = metrics
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name in self._UNGUARDED or not callable(attr):
+            return attr
+
+        def command(*args, **kwargs):
+            return self._execute(attr, *args, **kwargs)
+
+        return command
+
+    def pipeline(self, transaction: bool = True, shard_hint: Any = None):
+        return _GuardedPipeline(self, self._client.pipeline(transaction, shard_hint))
+
+    async def _execute(self, method: Callable, *args, **kwargs):
+        if not self.breaker.allow():
+            raise CacheUnavailableError("Redis is unavailable, circuit breaker is open")
+        started = time.perf_counter()
+        try:
+            result = await method(*args, **kwargs)
+        except (ConnectionError, TimeoutError):
+            self.metrics.errors += 1
+            self.breaker.record_failure()
+            raise
+        except RedisError:
+            # Redis answered, the command itself was wrong
+            self.metrics.errors += 1
+            self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        self.metrics.record_command(time.perf_counter() - started)
+        return result
+
+
+redis_breaker = CircuitBreaker(
+    CACHE_BREAKER_FAILURE_THRESHOLD, CACHE_BREAKER_RESET_TIMEOUT
+)
+cache_metrics = CacheMetrics()
+
+_client: Optional[ResilientRedis] = None
+_pubsub_client: Optional[Redis] = None
+
+
+def get_redis_client() -> ResilientRedis:
+    """Returns the process-wide Redis client, backed by a bounded connection pool."""
+    global _client
+    if _client is None:
+        pool = BlockingConnectionPool(
+            host=redis_credentials["host"],
+            port=redis_credentials["port"],
+            password=redis_credentials["password"],
+            max_connections=CACHE_REDIS_MAX_CONNECTIONS,
+            timeout=CACHE_REDIS_POOL_TIMEOUT,
+            socket_connect_timeout=CACHE_REDIS_CONNECT_TIMEOUT,
+            socket_timeout=CACHE_REDIS_SOCKET_TIMEOUT,
+        )
+        _client = ResilientRedis(
+            Redis(connection_pool=pool),
+            redis_breaker,
+            cache_metrics,
+        )
+    return _client
+
+
+def get_pubsub_client() -> Redis:
+    """
+    Returns the Redis client used for subscriptions. Subscribers block on reads
+    for as long as no message is published, so it has no socket timeout.
+    """
+    global _pubsub_client
+    if _pubsub_client is None:
+        _pubsub_client = Redis(
+            host=redis_credentials["host"],
+            port=redis_credentials["port"],
+            password=redis_credentials["password"],
+            socket_connect_timeout=CACHE_REDIS_CONNECT_TIMEOUT,
+            health_check_interval=30,
+        )
+    return _pubsub_client
+
+
+def get_cache_stats() -> dict:
+    """
+    Returns a snapshot of the cache metrics and the circuit breaker state for monitoring.
+    """
+    return {
+        "breaker": {
+            "state": redis_breaker.state,
+            "consecutive_failures": redis_breaker.failures,
+        },
+        **cache_metrics.snapshot(),
+    }
@@ -0,0 +1,140 @@
+import uuid
+import hashlib
+import datetime
+from abc import ABC, abstractmethod
+from enum import Enum
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Optional
+
+import msgpack
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+# msgpack extension type codes
+_EXT_UNLOADED = 0
+_EXT_UUID = 1
+_EXT_DATETIME = 2
+_EXT_DATE = 3
+_EXT_TIME = 4
+_EXT_DECIMAL = 5
+
+# Stands for a column that wasn't loaded on the cached instance
+_UNLOADED = object()
+_UNLOADED_EXT = msgpack.ExtType(_EXT_UNLOADED, b"")
+
+
+class CacheSerializer(ABC):
+    """
+    Turns model instances into cache payloads and back.
+
+    `CachingMixin` uses `MsgpackSerializer` unless a model sets its own
+    `cache_serializer`. Implementations return None from `loads` when a payload
+    can't be used (e.g. it was written for an older schema), which callers
+    treat as a cache miss.
+    """
+
+    @abstractmethod
+    def dumps(self, instance) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, model: type, data: bytes) -> Optional[Any]:
+        pass
+
+
+@lru_cache(maxsize=None)
+def model_schema(model: type) -> tuple[str, tuple]:
+    """
+    Returns the mapped columns of `model` and a short version derived from their
+    names and types (and the member names of Enum types), which changes whenever
+    a migration changes the model.
+    """
+    columns = tuple(inspect(model).column_attrs)
+    signature = "|".join(
+        f"{attr.key}:{type(attr.columns[0].type).__name__}"
+        f"{getattr(attr.columns[0].type, 'enums', '')}"
+        for attr in columns
+    )
+    return hashlib.sha1(signature.encode()).hexdigest()[:8], columns
+
+
+def _encode(value: Any) -> msgpack.ExtType:
+    if isinstance(value, uuid.UUID):
+        return msgpack.ExtType(_EXT_UUID, value.bytes)
+    if isinstance(value, datetime.datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, datetime.date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, datetime.time):
+        return msgpack.ExtType(_EXT_TIME, value.isoformat().encode())
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+    raise TypeError(f"Can't cache values of type {type(value).__name__}")
+
+
+def _decode(code: int, data: bytes) -> Any:
+    if code == _EXT_UNLOADED:
+        return _UNLOADED
+    if code == _EXT_UUID:
+        return uuid.UUID(bytes=data)
+    if code == _EXT_DATETIME:
+        return datetime.datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return datetime.date.fromisoformat(data.decode())
+    if code == _EXT_TIME:
+        return datetime.time.fromisoformat(data.decode())
+    if code == _EXT_DECIMAL:
+        return Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackSerializer(CacheSerializer):
+    """
+    Stores only the mapped column values, as a msgpack array
+    `[schema version, [value per column]]`.
+
+    Columns that weren't loaded on the instance are marked as such and stay
+    unloaded on the rehydrated instance. Enum members are stored by name.
+    Rehydrated instances are detached, as if loaded by a session that has been
+    closed: columns are readable, relationships are not loaded.
+    """
+
+    def dumps(self, instance) -> bytes:
+        version, columns = model_schema(type(instance))
+        loaded = instance.__dict__
+        values = []
+        for attr in columns:
+            value = loaded.get(attr.key, _UNLOADED)
+            if value is _UNLOADED:
+                value = _UNLOADED_EXT
+            elif isinstance(value, Enum):
+                value = value.name
+            values.append(value)
+        return msgpack.packb([version, values], default=_encode, use_bin_type=True)
+
+    def loads(self, model: type, data: bytes) -> Optional[Any]:
+        version, columns = model_schema(model)
+        try:
+            cached_version, values = msgpack.unpackb(data, ext_hook=_decode, raw=False)
+        except (ValueError, TypeError):
+            return None
+        if cached_version != version or len(values) != len(columns):
+            return None
+
+        instance = inspect(model).class_manager.new_instance()
+        for attr, value in zip(columns, values):
+            if value is _UNLOADED:
+                continue
+            enum_class = getattr(attr.columns[0].type, "enum_class", None)
+            if enum_class is not None and value is not None:
+                try:
+                    value = enum_class[value]
+                except KeyError:
+                    # The member was renamed or removed since
+                    return None
+            set_committed_value(instance, attr.key, value)
+        make_transient_to_detached(instance)
+        return instance
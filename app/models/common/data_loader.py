@@ -0,0 +1,116 @@
+import uuid
+import asyncio
+from collections import defaultdict
+from typing import Any, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class SessionLoader:
+    """
+    Batching loader behind `BaseMixin.get_by_id`, scoped to a database session
+    (and therefore to a request, since each request shares one session).
+
+    - Every `get_by_id` issued during the same event-loop tick is coalesced into
+      a single `get_by_ids` query per model.
+    - Results are kept in an identity map, so asking for an id again is free.
+      Lookups with a column projection are batched and mapped separately.
+    - The identity map is dropped whenever the session flushes or its transaction
+      ends (commit, rollback or close), so writes are never hidden behind a stale
+      result, including a cached "not found".
+
+    Batches run one after another, never concurrently, because an `AsyncSession`
+    doesn't allow concurrent operations: batches of different models within a tick
+    are loaded in turn, and a batch dispatched on a later tick waits for the
+    previous ones to finish.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self._results: dict[tuple, asyncio.Future] = {}
+        self._pending: dict[tuple, list[tuple[Any, asyncio.Future]]] = defaultdict(list)
+        self._dispatch_scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+        # Serializes batches dispatched on different ticks
+        self._lock = asyncio.Lock()
+        event.listen(db_session.sync_session, "after_flush", self._on_write)
+        event.listen(
+            db_session.sync_session, "after_transaction_end", self._on_transaction_end
+        )
+
+    @classmethod
+    def for_session(cls, db_session: AsyncSession) -> "SessionLoader":
+        """Returns the loader attached to the session, creating it on first use."""
+        loader = db_session.info.get("loader")
+        if loader is None:
+            loader = cls(db_session)
+            db_session.info["loader"] = loader
+        return loader
+
+    def load(
+        self, model: type, _id: Any, projection: Optional[tuple[str, ...]] = None
+    ) -> asyncio.Future:
+        """
+        Schedules `_id` to be fetched with the next batch of `model` and returns a
+        future resolving to the instance, or None if it doesn't exist or is soft deleted.
+        """
+        if isinstance(_id, str):
+            _id = uuid.UUID(_id)
+        key = (model, projection, _id)
+        future = self._results.get(key)
+        if future is None or future.cancelled():
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._results[key] = future
+            self._pending[(model, projection)].append((_id, future))
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+        return future
+
+    def clear(self) -> None:
+        """Forgets every loaded result."""
+        self._results.clear()
+
+    def _on_write(self, session, flush_context) -> None:
+        self.clear()
+
+    def _on_transaction_end(self, session, transaction) -> None:
+        self.clear()
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, defaultdict(list)
+        self._dispatch_scheduled = False
+        task = asyncio.ensure_future(self._load_batches(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batches(
+        self, pending: dict[tuple, list[tuple[Any, asyncio.Future]]]
+    ) -> None:
+        async with self._lock:
+            await self._load_models(pending)
+
+    async def _load_models(
+        self, pending: dict[tuple, list[tuple[Any, asyncio.Future]]]
+    ) -> None:
+        for (model, projection), requests in pending.items():
+            try:
+                instances = await model.get_by_ids(
+                    self.db_session, [_id for _id, _ in requests], projection
+                )
+            except Exception as e:
+                for _id, future in requests:
+                    self._results.pop((model, projection, _id), None)
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            found = {
+                instance.id: instance
+                for instance in instances
+                if instance.deleted_at is None
+            }
+            for _id, future in requests:
+                if not future.done():
+                    future.set_result(found.get(_id))
@@ -1,23 +1,120 @@
+import os
 from typing import Optional, Any
-from sqlalchemy import func, or_, select, String
+import Levenshtein
+from sqlalchemy import event, func, or_, select, Column, Computed, DDL, Index, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, RelationshipProperty, DeclarativeMeta
+from sqlalchemy.orm import (
+    aliased,
+    declared_attr,
+    deferred,
+    RelationshipProperty,
+    DeclarativeMeta,
+)
+
+
+# Text search configuration used for stored and query-time vectors alike
+SEARCH_CONFIG = "english"
+
+# Fuzzy search: minimum trigram similarity of a match (0 to 1), and how many of the
+# best trigram matches are re-ranked by Levenshtein distance
+SEARCH_SIMILARITY_THRESHOLD = float(
+    os.getenv("SEARCH_SIMILARITY_THRESHOLD", default=0.3)
+)
+SEARCH_RERANK_CANDIDATES = int(os.getenv("SEARCH_RERANK_CANDIDATES", default=50))
 
 
 class SearchMixin(metaclass=DeclarativeMeta):
     """
     Provides robust and efficient search functionality, leveraging PostgreSQL's
-    tsvector and tsquery for full-text searching and the Levenshtein library
-    for optimized fuzzy matching.
+    tsvector and tsquery for full-text searching and pg_trgm trigram similarity,
+    refined with the Levenshtein library, for fuzzy matching.
 
     Supports:
         - Full-text search
-        - Fuzzy search (using Levenshtein distance)
+        - Fuzzy search (trigram similarity, top candidates re-ranked by Levenshtein distance)
         - Search across multiple entities and relationships
         - Weighted search terms
         - Ranking of search results
+        - Stored, GIN-indexed search vectors and trigram indexes
+
+    Models declare the fields searched by default, with their weight ("A" to "D",
+    highest first), in `search_fields`. They are then materialised into a generated
+    `search_vector` column with a GIN index, which `search` matches and ranks
+    against instead of building a vector for every row at query time:
+
+        search_fields = {"name": "A", "description": "B"}
+
+    Models without `search_fields`, and searches over other fields, fall back to
+    computing the vector per row.
+
+    Fields listed in `fuzzy_fields` get a trigram GIN index on their lowercased
+    value, which fuzzy searches over them use. Keep it to short fields such as
+    names: trigram indexes of long texts are large and match almost anything.
     """
 
+    search_fields: dict[str, str] = {}
+    fuzzy_fields: tuple[str, ...] = ()
+
+    @declared_attr
+    def search_vector(cls):
+        if not cls.search_fields:
+            return None
+        expression = " || ".join(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+            f"coalesce({field}, '')), '{weight}')"
+            for field, weight in cls.search_fields.items()
+        )
+        column = Column(TSVECTOR, Computed(expression, persisted=True))
+        Index(
+            f"ix_{cls.__tablename__}_search_vector", column, postgresql_using="gin"
+        )
+        # Only ever read by the database
+        return deferred(column)
+
+    @classmethod
+    def _text_columns(cls) -> list[str]:
+        """The plain string columns, searched when a model declares no `search_fields`."""
+        return [
+            field
+            for field in cls._plain_columns()
+            if isinstance(getattr(cls, field).type, String)
+        ]
+
+    @classmethod
+    def _search_vector(cls, fields: Optional[list[str]] = None):
+        """
+        Returns the tsvector to match `fields` against: the stored `search_vector`
+        when they are the model's `search_fields`, otherwise one computed per row.
+        """
+        if cls.search_fields and (not fields or set(fields) == set(cls.search_fields)):
+            return cls.search_vector
+        fields = fields or cls._text_columns()
+        return func.to_tsvector(
+            SEARCH_CONFIG,
+            func.concat_ws(" ", *[getattr(cls, field) for field in fields]),
+        )
+
+    @classmethod
+    def _fuzzy_distance(cls, instance, term: str, fields: list[str]) -> int:
+        """
+        Returns the smallest Levenshtein distance between `term` and any run of as
+        many words in the loaded `fields` of `instance`.
+        """
+        term = " ".join(term.lower().split())
+        size = len(term.split()) or 1
+        distance = len(term)
+        for field in fields:
+            # Unloaded (projected out) fields can't be read on an async session
+            value = instance.__dict__.get(field)
+            if not isinstance(value, str):
+                continue
+            words = value.lower().split()
+            for start in range(max(len(words) - size + 1, 1)):
+                window = " ".join(words[start : start + size])
+                distance = min(distance, Levenshtein.distance(term, window))
+        return distance
+
     @classmethod
     async def search(
         cls,
@@ -27,60 +124,77 @@ class SearchMixin(metaclass=DeclarativeMeta):
         relationships: Optional[dict[str, tuple[str, Any]]] = None,
         weights: Optional[dict[str, float]] = None,
         fuzzy_threshold: int = 2,  # Maximum Levenshtein distance for fuzzy matches
+        similarity_threshold: float = SEARCH_SIMILARITY_THRESHOLD,
         ranking: bool = False,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        projection: Optional[list[str]] = None,
     ) -> list:
         """
         Performs a comprehensive search across specified fields and relationships.
 
+        Fuzzy matches are rows whose fields are trigram-similar to a search term
+        (`field % term`, served by the `fuzzy_fields` trigram indexes). Unless results
+        are ranked, they come ordered by similarity, and the best
+        `SEARCH_RERANK_CANDIDATES` of them are re-ranked in process: those within
+        `fuzzy_threshold` edits of a term move to the front, closest first.
+
         Args:
             db_session (AsyncSession): The async database session.
             search_term (str): The term to search for.
-            fields (Optional[List[str]]): A list of fields to search in the current entity.
+            fields (Optional[List[str]]): A list of fields to search in the current entity,
+                the model's `search_fields` (or all its string columns) by default.
             relationships (Optional[Dict[str, Tuple[str, Any]]]): A dictionary specifying relationships to search.
                 Keys are relationship attributes on the model, values are tuples: (field_to_search, filter_value).
             weights (Optional[Dict[str, float]]): A dictionary assigning weights to search terms.
-                Keys are search terms, values are their corresponding weights.
-            fuzzy_threshold (int): Maximum Levenshtein distance for a fuzzy match.
+                Keys are search terms, values are their corresponding weights in the ranking.
+                Defaults to `search_term` alone.
+            fuzzy_threshold (int): Maximum Levenshtein distance for a fuzzy match to be
+                moved up when re-ranking. 0 disables fuzzy matching. Searches over the
+                default fields only fuzzy match the model's `fuzzy_fields`: on models
+                declaring none, they are full-text only unless `fields` are given.
+            similarity_threshold (float): Minimum trigram similarity (0 to 1) of a fuzzy match.
             ranking (bool): Whether to enable result ranking based on relevance.
             limit (Optional[int]): Limit the number of results.
             offset (Optional[int]): Offset for pagination.
+            projection (Optional[List[str]]): Columns to load on the returned instances,
+                all of them by default (see `BaseMixin._projection_options`).
 
         Returns:
             list: A list of matching model instances, optionally ranked.
         """
-
+        search_query = select(cls).options(*cls._projection_options(projection))
+        vector = cls._search_vector(fields)
         if not fields:
-            fields = [
-                column.name
-                for column in cls.__table__.columns
-                if isinstance(column.type, String)
-            ]
+            fields = list(cls.search_fields) or cls._text_columns()
+        weights = weights or {search_term: 1.0}
 
-        search_query = select(cls)
+        fuzzy = fuzzy_threshold > 0
+        # Fuzzy matching only considers text columns, the indexed ones when searching by default
+        fuzzy_fields = [
+            field
+            for field in (
+                fields if set(fields) != set(cls.search_fields) else cls.fuzzy_fields
+            )
+            if isinstance(getattr(cls, field).type, String)
+        ]
+        similarities = [
+            func.similarity(func.lower(getattr(cls, field)), func.lower(term))
+            for term in weights
+            for field in fuzzy_fields
+        ]
 
         # Full-text search and fuzzy search logic
         search_conditions = []
-        for term, weight in (weights or {"": 1.0}).items():
-            vector = func.to_tsvector(
-                "english", func.concat(*[getattr(cls, field) for field in fields])
-            )
-            query = func.plainto_tsquery("english", term)
-            search_conditions.append(
-                vector.match(query, postgresql_regconfig="english")
-            )
+        for term in weights:
+            query = func.plainto_tsquery(SEARCH_CONFIG, term)
+            search_conditions.append(vector.op("@@")(query))
 
-            # Use Levenshtein.distance for fuzzy matching
-            if fuzzy_threshold > 0:
-                for field in fields:
+            # Trigram similarity, as the operator so that the trigram indexes are used
+            if fuzzy:
+                for field in fuzzy_fields:
                     search_conditions.append(
-                        func.funcfilter(
-                            func.levenshtein(
-                                func.lower(getattr(cls, field)), func.lower(term)
-                            ),
-                            lambda dist: dist <= fuzzy_threshold,
-                        )
+                        func.lower(getattr(cls, field)).op("%")(func.lower(term))
                     )
 
         search_query = search_query.where(or_(*search_conditions))
@@ -96,42 +210,91 @@ class SearchMixin(metaclass=DeclarativeMeta):
                 )
 
                 search_conditions = []
-                vector = func.to_tsvector(
-                    "english", func.concat(*[getattr(rel_alias, rel_field)])
+                rel_vector = func.to_tsvector(
+                    SEARCH_CONFIG, func.concat(*[getattr(rel_alias, rel_field)])
                 )
-                query = func.plainto_tsquery("english", search_term)
-                search_conditions.append(vector.match(query))
+                query = func.plainto_tsquery(SEARCH_CONFIG, search_term)
+                search_conditions.append(rel_vector.op("@@")(query))
 
-                if fuzzy_threshold > 0:
+                if fuzzy:
                     search_conditions.append(
-                        func.funcfilter(
-                            func.levenshtein(
-                                func.lower(getattr(cls, field)), func.lower(term)
-                            ),
-                            lambda dist: dist <= fuzzy_threshold,
+                        func.lower(getattr(rel_alias, rel_field)).op("%")(
+                            func.lower(search_term)
                         )
                     )
 
                 search_query = search_query.where(or_(*search_conditions))
 
-        # Ranking logic (using a simplified ranking approach for demonstration)
+        # Ranking logic: field weights come from the vector, term weights scale the ranks
         if ranking:
-            rank = func.ts_rank_cd(
-                func.setweight(
-                    func.to_tsvector("english", func.coalesce(cls.name, "")), "A"
-                )
-                | func.setweight(
-                    func.to_tsvector("english", func.coalesce(cls.description, "")), "B"
-                ),
-                func.plainto_tsquery("english", search_term),
+            ranks = [
+                func.ts_rank_cd(vector, func.plainto_tsquery(SEARCH_CONFIG, term))
+                * weight
+                for term, weight in weights.items()
+            ]
+            search_query = search_query.order_by(sum(ranks[1:], ranks[0]).desc())
+
+        # Without ranking, fuzzy results are ordered by similarity and the best
+        # candidates re-ranked here, so fetch at least all of those
+        rerank = fuzzy and not ranking and bool(similarities)
+        if rerank:
+            search_query = search_query.order_by(func.greatest(*similarities).desc())
+            start = offset or 0
+            end = start + limit if limit else None
+            if end is not None:
+                search_query = search_query.limit(max(end, SEARCH_RERANK_CANDIDATES))
+        else:
+            if limit:
+                search_query = search_query.limit(limit)
+            if offset:
+                search_query = search_query.offset(offset)
+
+        if fuzzy and (fuzzy_fields or relationships):
+            # `%` matches above pg_trgm's threshold, set for this transaction only
+            await db_session.execute(
+                select(
+                    func.set_config(
+                        "pg_trgm.similarity_threshold", str(similarity_threshold), True
+                    )
+                ).execution_options(use_replica=True)
+            )
+        result = await db_session.execute(
+            search_query.execution_options(use_replica=True)
+        )
+        instances = result.scalars().all()
+        if not rerank:
+            return instances
+
+        candidates = instances[:SEARCH_RERANK_CANDIDATES]
+        distances = {
+            id(instance): min(
+                cls._fuzzy_distance(instance, term, fuzzy_fields) for term in weights
             )
-            search_query = search_query.order_by(rank.desc())
+            for instance in candidates
+        }
+        # Stable sort: close matches first by distance, the others keep their similarity order
+        candidates.sort(
+            key=lambda instance: min(distances[id(instance)], fuzzy_threshold + 1)
+        )
+        return (candidates + instances[SEARCH_RERANK_CANDIDATES:])[start:end]
 
-        if limit:
-            search_query = search_query.limit(limit)
-        if offset:
-            search_query = search_query.offset(offset)
 
-        async with db_session as session:
-            result = await session.execute(search_query)
-            return result.scalars().all()
+@event.listens_for(SearchMixin, "after_mapper_constructed", propagate=True)
+def _add_trigram_indexes(mapper, cls):
+    """Adds trigram GIN indexes for the `fuzzy_fields` of a model once it's mapped."""
+    if not cls.fuzzy_fields:
+        return
+    table = mapper.local_table
+    for field in cls.fuzzy_fields:
+        label = f"{field}_lower"
+        Index(
+            f"ix_{table.name}_{field}_trgm",
+            func.lower(table.c[field]).label(label),
+            postgresql_using="gin",
+            postgresql_ops={label: "gin_trgm_ops"},
+        )
+    event.listen(
+        table,
+        "before_create",
+        DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+    )
@@ -1,7 +1,9 @@
+from uuid import UUID as PyUUID
 from sqlalchemy import Column, ForeignKey, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, mapped_column
 
+from app.database import register_warmup
 from app.models.common import (
     Base,
     BaseMixin,
@@ -13,6 +15,8 @@ from app.models.common import (
 
 class PricingTier(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     __tablename__ = "pricing_tiers"
+    # Hot and rarely changing: also cached in each worker's memory
+    local_cache_size = 1024
 
     retail_price = Column(Numeric, nullable=False)
     max_price_threshold = Column(Numeric)
@@ -35,3 +39,7 @@ class PricingTier(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
 
     # Relationships
     price_factors = relationship("PriceFactors", backref="pricing_tiers")
+
+
+# Prepare the pricing tier lookup used by price calculations on pooled connections at startup
+register_warmup(lambda db_session: PricingTier.get_by_id(db_session, PyUUID(int=0)))
@@ -1,9 +1,11 @@
 from enum import Enum
+from uuid import UUID as PyUUID
 from sqlalchemy import Column, Integer, ForeignKey, String, Boolean, and_
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import mapped_column, relationship
 from sqlalchemy.types import Enum as SQLAEnum
 
+from app.database import register_warmup
 from app.models.common import (
     Base,
     BaseMixin,
@@ -67,3 +69,7 @@ class Articles(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     lender_payments = relationship("LenderPayments", backref="articles")
     user_saved_items = relationship("UserSavedItems", backref="articles")
     order_items = relationship("OrderItems", backref="articles")
+
+
+# Prepare the article lookup used by availability checks on pooled connections at startup
+register_warmup(lambda db_session: Articles.get_by_id(db_session, PyUUID(int=0)))
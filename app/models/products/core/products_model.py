@@ -1,4 +1,5 @@
 from enum import Enum, auto
+from uuid import UUID as PyUUID
 from sqlalchemy import Column, ForeignKey, String, Text, func, and_
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import (
@@ -9,6 +10,7 @@ from sqlalchemy.orm import (
     Session,
 )
 
+from app.database import register_warmup
 from app.models.common import (
     Base,
     BaseMixin,
@@ -49,6 +51,12 @@ class FilterKeys(Enum):
 
 class Products(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     __tablename__ = "products"
+    # Long descriptions compress well, even in shorter entries
+    cache_compress_threshold = 256
+    # Catalog search matches the stored, indexed vector of these fields
+    search_fields = {"name": "A", "description": "B"}
+    # Typo-tolerant search on names, through a trigram index
+    fuzzy_fields = ("name",)
 
     name = Column(String, nullable=False)
     description = Column(Text)
@@ -318,3 +326,7 @@ class Products(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     def get_occasional_category_names(self):
         """Returns a list of names of occasional categories associated with the product."""
         return [oc.occasional_category.name for oc in self.occasional_categories]
+
+
+# Prepare the product lookup on pooled connections at startup
+register_warmup(lambda db_session: Products.get_by_id(db_session, PyUUID(int=0)))
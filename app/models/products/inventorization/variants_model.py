@@ -13,6 +13,8 @@ from app.models.common import (
 
 class Variants(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     __tablename__ = "variants"
+    # Cached variants are dropped along with their products' cache
+    cache_tags = ("Products",)
 
     name = Column(String, nullable=False)
     index = Column(Integer)
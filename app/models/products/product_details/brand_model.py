@@ -12,6 +12,8 @@ from app.models.common import (
 
 class Brand(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     __tablename__ = "brands"
+    # Hot and rarely changing: also cached in each worker's memory
+    local_cache_size = 1024
 
     name = Column(String, nullable=False)
 
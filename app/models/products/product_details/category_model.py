@@ -13,6 +13,8 @@ from app.models.common import (
 
 class Categories(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     __tablename__ = "categories"
+    # Hot and rarely changing: also cached in each worker's memory
+    local_cache_size = 1024
 
     name = Column(String)
     is_default = Column(Boolean)
@@ -7,6 +7,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
 from firebase_admin import auth as firebase_auth
 
+from app.database import register_warmup
 from app.models.common import (
     Base,
     BaseMixin,
@@ -74,11 +75,10 @@ class User(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
         Returns:
             Optional[User]: The User object if found, otherwise None.
         """
-        async with db_session as session:
-            result = await session.execute(
-                select(cls).where(cls.login == login, cls.deleted_at.is_(None))
-            )
-            return result.scalars().first()
+        result = await db_session.execute(
+            select(cls).where(cls.login == login, cls.deleted_at.is_(None))
+        )
+        return result.scalars().first()
 
     async def activate_account(self, db_session: AsyncSession):
         try:
@@ -310,3 +310,7 @@ class User(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
         """
         if password != password_confirmation:
             raise ValueError("Passwords do not match.")
+
+
+# Prepare the login lookup on pooled connections at startup
+register_warmup(lambda db_session: User.get_user_by_login(db_session, ""))
@@ -12,6 +12,8 @@ from app.models.common import (
 
 class Roles(Base, BaseMixin, SearchMixin, CachingMixin, BulkActionsMixin):
     __tablename__ = "roles"
+    # Hot and rarely changing: also cached in each worker's memory
+    local_cache_size = 1024
 
     code = Column(String, nullable=False)
     name = Column(String)
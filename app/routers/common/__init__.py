@@ -0,0 +1 @@
+from .streaming_response import stream_model_response
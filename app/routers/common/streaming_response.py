@@ -0,0 +1,114 @@
+import io
+import csv
+import json
+from typing import Any, AsyncIterator, Optional
+from fastapi.responses import StreamingResponse
+
+from app.database.session import async_session_factory
+
+
+# Rows serialized into a single chunk of the response body
+CHUNK_ROWS = 500
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _serialize_value(value: Any) -> Any:
+    # JSON and ARRAY values are kept as they are, and encoded by each format
+    if value is None or isinstance(value, (str, int, float, bool, dict, list)):
+        return value
+    if hasattr(value, "value"):  # Enum members
+        return value.value
+    return str(value)
+
+
+async def _stream_rows(model, columns: list[str], **stream_kwargs) -> AsyncIterator[dict]:
+    # The request-scoped session is closed as soon as the response starts, so the
+    # export runs on its own session that lives as long as the body is being sent.
+    async with async_session_factory() as db_session:
+        async for instance in model.stream(
+            db_session, projection=columns, **stream_kwargs
+        ):
+            yield {column: _serialize_value(getattr(instance, column)) for column in columns}
+
+
+async def _ndjson_chunks(rows: AsyncIterator[dict]) -> AsyncIterator[str]:
+    buffer = []
+    async for row in rows:
+        buffer.append(json.dumps(row, default=str))
+        if len(buffer) >= CHUNK_ROWS:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+async def _csv_chunks(rows: AsyncIterator[dict], columns: list[str]) -> AsyncIterator[str]:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=columns)
+    writer.writeheader()
+    count = 0
+    async for row in rows:
+        writer.writerow(
+            {
+                column: json.dumps(value, default=str)
+                if isinstance(value, (dict, list))
+                else value
+                for column, value in row.items()
+            }
+        )
+        count += 1
+        if count % CHUNK_ROWS == 0:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+    yield output.getvalue()
+
+
+def stream_model_response(
+    model,
+    export_format: str = "ndjson",
+    columns: Optional[list[str]] = None,
+    filename: Optional[str] = None,
+    **stream_kwargs,
+) -> StreamingResponse:
+    """
+    Builds a streaming HTTP response exporting model rows as NDJSON or CSV.
+
+    Rows are read with `BaseMixin.stream` and written out in chunks as they arrive,
+    so exports of large tables never hold the whole result in worker memory.
+
+    Args:
+        model: The model class to export.
+        export_format (str): "ndjson" or "csv".
+        columns (Optional[List[str]]): Columns to export, all plain columns by default
+            (see `BaseMixin._plain_columns`).
+        filename (Optional[str]): When set, the response is served as a file download.
+        **stream_kwargs: Passed to `BaseMixin.stream` (filters, relationships, order_by, batch_size).
+
+    Returns:
+        StreamingResponse: The response streaming the exported rows.
+
+    Raises:
+        ValueError: If the export format is not supported.
+    """
+    if export_format not in MEDIA_TYPES:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    columns = columns or model._plain_columns()
+    rows = _stream_rows(model, columns, **stream_kwargs)
+    body = (
+        _csv_chunks(rows, columns)
+        if export_format == "csv"
+        else _ndjson_chunks(rows)
+    )
+
+    headers = {}
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(
+        body, media_type=MEDIA_TYPES[export_format], headers=headers
+    )
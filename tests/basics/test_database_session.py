@@ -0,0 +1,247 @@
+# tests/basics/test_database_session.py
+import time
+from contextlib import asynccontextmanager
+from http.cookies import SimpleCookie
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Response
+from sqlalchemy import exc, insert, select, Column, Integer, MetaData, Table
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+
+from app import main
+from app.database import session
+from app.database.session import (
+    PRIMARY_STICKY_COOKIE,
+    MonitoredQueuePool,
+    RoutingSession,
+    get_async_session,
+    get_connect_args,
+    get_engine_options,
+    get_pool_stats,
+    pin_to_primary,
+    register_warmup,
+    warm_up_pool,
+)
+
+
+class FakeConnection:
+    """DBAPI connection stand-in for pools that never reach a database."""
+
+    def close(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def engine_with(pool):
+    return SimpleNamespace(sync_engine=SimpleNamespace(pool=pool))
+
+
+def test_engine_options_follow_the_pool_mode(monkeypatch):
+    """Test that the queue pool is bounded by the settings, and the null pool isn't."""
+    options = get_engine_options()
+    assert options["poolclass"] is MonitoredQueuePool
+    assert options["pool_size"] == session.DB_POOL_SIZE
+    assert options["max_overflow"] == session.DB_MAX_OVERFLOW
+    assert options["pool_timeout"] == session.DB_POOL_TIMEOUT
+
+    monkeypatch.setattr(session, "DB_POOL_MODE", "null")
+    options = get_engine_options()
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_count_waits_and_timeouts():
+    """Test that checkouts blocked on an exhausted pool are counted in the stats."""
+    pool = MonitoredQueuePool(FakeConnection, pool_size=1, max_overflow=0, timeout=0.01)
+    connection = await greenlet_spawn(pool.connect)
+    stats = get_pool_stats(engine_with(pool))
+    assert stats["size"] == 1
+    assert stats["max_overflow"] == 0
+    assert stats["checked_out"] == 1
+    assert stats["waits"] == 0
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    stats = get_pool_stats(engine_with(pool))
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_time_seconds"] >= 0.01
+    await greenlet_spawn(connection.close)
+    assert get_pool_stats(engine_with(pool))["idle"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_are_exposed_for_each_engine(monkeypatch):
+    """Test that /healthz/pool reports the primary pool, and the replica one if any."""
+    primary = MonitoredQueuePool(FakeConnection, pool_size=2, max_overflow=1)
+    monkeypatch.setattr(session, "engine", engine_with(primary))
+    monkeypatch.setattr(main, "replica_engine", None)
+    stats = await main.pool_stats()
+    assert list(stats) == ["database_pool"]
+    assert stats["database_pool"]["size"] == 2
+
+    monkeypatch.setattr(main, "replica_engine", engine_with(NullPool(FakeConnection)))
+    stats = await main.pool_stats()
+    assert stats["replica_pool"]["status"] == "NullPool"
+
+
+def fake_request(method="GET", cookies=None):
+    return SimpleNamespace(
+        method=method, cookies=cookies or {}, state=SimpleNamespace()
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_shares_one_session():
+    """Test that the dependencies of a request share one lazily created session."""
+    request = fake_request()
+    assert getattr(request.state, "db", None) is None
+
+    first = await anext(get_async_session(request))
+    second = await anext(get_async_session(request))
+    assert first is second is request.state.db
+    await first.close()
+
+
+items = Table("routed_item", MetaData(), Column("id", Integer, primary_key=True))
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    """Primary and replica engines telling apart where a statement was routed."""
+    primary = SimpleNamespace(sync_engine="primary")
+    replica = SimpleNamespace(sync_engine="replica")
+    monkeypatch.setattr(session, "engine", primary)
+    monkeypatch.setattr(session, "replica_engine", replica)
+    return primary, replica
+
+
+def test_reads_opting_in_go_to_the_replica(engines):
+    """Test that reads use the replica only when asked to, and writes the primary."""
+    routing = RoutingSession()
+    read = select(items)
+    assert routing.get_bind(clause=read) == "primary"
+    replica_read = read.execution_options(use_replica=True)
+    assert routing.get_bind(clause=replica_read) == "replica"
+    routing.info["replica"] = True
+    assert routing.get_bind(clause=read) == "replica"
+
+    assert routing.get_bind(clause=insert(items)) == "primary"
+    assert routing.info["wrote"]
+
+
+def test_reads_stay_on_the_primary_after_a_write(engines):
+    """Test that once a session flushed, it reads its own writes from the primary."""
+    routing = RoutingSession()
+    routing.info["replica"] = True
+    routing._flushing = True
+    assert routing.get_bind() == "primary"
+    routing._flushing = False
+
+    assert routing.info["wrote"]
+    assert routing.get_bind(clause=select(items)) == "primary"
+
+
+def test_everything_goes_to_the_primary_without_a_replica(engines, monkeypatch):
+    """Test that sessions work unchanged when no replica is configured."""
+    monkeypatch.setattr(session, "replica_engine", None)
+    routing = RoutingSession(info={"replica": True})
+    read = select(items).execution_options(use_replica=True)
+    assert routing.get_bind(clause=read) == "primary"
+    assert "wrote" not in routing.info
+
+
+@pytest.mark.asyncio
+async def test_recent_writers_read_from_the_primary(engines):
+    """Test that the read-your-writes cookie keeps a client's reads on the primary."""
+    response = Response()
+    pin_to_primary(response)
+    cookie = SimpleCookie(response.headers["set-cookie"])[PRIMARY_STICKY_COOKIE]
+    assert int(cookie["max-age"]) == session.DB_READ_YOUR_WRITES_SECONDS
+
+    request = fake_request(cookies={PRIMARY_STICKY_COOKIE: cookie.value})
+    pinned = await anext(get_async_session(request))
+    assert pinned.info["replica"] and pinned.info["primary_only"]
+    read = select(items).execution_options(use_replica=True)
+    assert pinned.sync_session.get_bind(clause=read) == "primary"
+
+    # Once the window is over, or without a cookie, GET requests read from the replica
+    expired = fake_request(cookies={PRIMARY_STICKY_COOKIE: str(time.time() - 1)})
+    invalid = fake_request(cookies={PRIMARY_STICKY_COOKIE: "x"})
+    for request in (expired, invalid, fake_request()):
+        unpinned = await anext(get_async_session(request))
+        assert unpinned.sync_session.get_bind(clause=select(items)) == "replica"
+    # Other methods don't opt the whole session in
+    posted = await anext(get_async_session(fake_request("POST")))
+    assert posted.sync_session.get_bind(clause=select(items)) == "primary"
+
+
+def test_primary_is_not_pinned_without_a_replica(monkeypatch):
+    """Test that no cookie is set when reads can't be routed elsewhere anyway."""
+    monkeypatch.setattr(session, "replica_engine", None)
+    response = Response()
+    pin_to_primary(response)
+    assert "set-cookie" not in response.headers
+
+
+class WarmedEngine:
+    """Engine stand-in counting the connections opened by the warm-up."""
+
+    def __init__(self):
+        self.connections = []
+
+    @asynccontextmanager
+    async def connect(self):
+        connection = SimpleNamespace(sync_engine=SimpleNamespace())
+        self.connections.append(connection)
+        yield connection
+
+
+@pytest.fixture
+def warmup(monkeypatch):
+    monkeypatch.setattr(session, "WARMUP_STATEMENTS", [])
+    monkeypatch.setattr(session, "DB_POOL_WARM_CONNECTIONS", 3)
+    return WarmedEngine()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_the_registered_statements_on_each_connection(warmup):
+    """Test that every registered statement is prepared once per warmed connection."""
+    prepared = []
+
+    @register_warmup
+    async def failing(db_session):
+        raise exc.SQLAlchemyError("relation does not exist")
+
+    @register_warmup
+    async def hot_query(db_session):
+        prepared.append(db_session.bind)
+
+    await warm_up_pool(warmup)
+
+    assert len(warmup.connections) == 3
+    # A failing statement doesn't keep the others from being prepared
+    assert sorted(map(id, prepared)) == sorted(map(id, warmup.connections))
+
+
+@pytest.mark.asyncio
+async def test_warm_up_only_connects_behind_pgbouncer(warmup, monkeypatch):
+    """Test that no statement is prepared when prepared statements aren't cached."""
+    monkeypatch.setattr(session, "DB_PGBOUNCER_MODE", True)
+    prepared = []
+    register_warmup(prepared.append)
+
+    await warm_up_pool(warmup)
+    assert len(warmup.connections) == 3
+    assert prepared == []
+    assert get_connect_args()["statement_cache_size"] == 0
+
+    monkeypatch.setattr(session, "DB_POOL_MODE", "null")
+    await warm_up_pool(warmup)
+    assert len(warmup.connections) == 3
@@ -1,9 +1,12 @@
 # tests/common/test_base_models.py
+import enum
+import asyncio
 import pytest
-from sqlalchemy import func, Column, String
+from sqlalchemy import func, select, Column, Enum, ForeignKey, String, Text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import UUID
+from sqlalchemy.orm import UUID, relationship
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql
 
 from app.models.common import BaseMixin, Base
 from app.models.users.core import User, UserInfo
@@ -18,6 +21,28 @@ class MockModel(Base, BaseMixin):
     name = Column(String)
 
 
+class MockStatus(enum.Enum):
+    draft = "Draft"
+    published = "Published"
+
+
+class MockStatusModel(Base, BaseMixin):
+    __tablename__ = "mock_status_model"
+    status = Column(Enum(MockStatus))
+
+
+class MockShelf(Base, BaseMixin):
+    __tablename__ = "mock_shelf"
+    name = Column(String)
+    description = Column(Text)
+    items = relationship("MockShelfItem", lazy="joined")
+
+
+class MockShelfItem(Base, BaseMixin):
+    __tablename__ = "mock_shelf_item"
+    shelf_id = Column(ForeignKey("mock_shelf.id"))
+
+
 @pytest.mark.asyncio
 async def test_base_mixin_get_by_id():
     """Test retrieving a model instance by its ID."""
@@ -41,6 +66,25 @@ async def test_base_mixin_get_by_id_nonexistent():
         assert retrieved_instance is None
 
 
+@pytest.mark.asyncio
+async def test_base_mixin_get_by_id_batched():
+    """Test that concurrent lookups in one session are coalesced and deduplicated."""
+    async with get_async_session() as session:
+        mock_instance1 = MockModel(name="Instance 1")
+        mock_instance2 = MockModel(name="Instance 2")
+        session.add_all([mock_instance1, mock_instance2])
+        await session.commit()
+
+        first, second, again = await asyncio.gather(
+            MockModel.get_by_id(session, mock_instance1.id),
+            MockModel.get_by_id(session, mock_instance2.id),
+            MockModel.get_by_id(session, mock_instance1.id),
+        )
+        assert first.name == "Instance 1"
+        assert second.name == "Instance 2"
+        assert again is first
+
+
 @pytest.mark.asyncio
 async def test_base_mixin_get_all():
     """Test retrieving all instances of a model."""
@@ -180,6 +224,174 @@ async def test_base_mixin_delete_already_deleted():
 # Test cases for filtering, pagination, and other base mixin methods can be added here.
 
 
+@pytest.mark.asyncio
+async def test_base_mixin_paginate_by_cursor():
+    """Test walking through all pages with keyset pagination."""
+    async with get_async_session() as session:
+        session.add_all([MockModel(name=f"Instance {i}") for i in range(5)])
+        await session.commit()
+
+        seen, cursor = [], None
+        while True:
+            items, cursor = await MockModel.paginate_by_cursor(
+                session, page_size=2, cursor=cursor
+            )
+            seen.extend(item.id for item in items)
+            if cursor is None:
+                break
+        assert len(seen) == len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_base_mixin_count_matches_filter():
+    """Test that the exact count agrees with the filtered results."""
+    async with get_async_session() as session:
+        session.add_all([MockModel(name="Counted") for _ in range(3)])
+        await session.commit()
+
+        filters = {"name": "Counted"}
+        total = await MockModel.count(session, filters=filters, ttl=0)
+        assert total == len(await MockModel.filter(session, filters=filters))
+
+
+class RecordingSession:
+    """Answers `execute` with canned scalars, recording the statements it got."""
+
+    def __init__(self, *scalars):
+        self.scalars = list(scalars)
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        value = self.scalars.pop(0)
+        return type("Result", (), {"scalar": lambda self: value})()
+
+    async def stream(self, statement, params=None):
+        self.statements.append(statement)
+        rows = self.scalars
+
+        async def scalars():
+            for row in rows:
+                yield row
+
+        return type("AsyncResult", (), {"scalars": lambda self: scalars()})()
+
+
+@pytest.mark.asyncio
+async def test_base_mixin_count_estimates_filtered_rows():
+    """Test that estimated counts read the EXPLAIN row estimate on the replica."""
+    plan = '[{"Plan": {"Plan Rows": 1234}}]'
+    session = RecordingSession(500_000, plan)
+
+    total = await MockModel.count(session, filters={"name": "A"}, mode="estimated")
+    assert total == 1234
+
+    explain = session.statements[-1]
+    assert explain.get_execution_options()["use_replica"] is True
+    sql = str(explain.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+
+
+@pytest.mark.asyncio
+async def test_base_mixin_count_auto_estimates_large_tables_only():
+    """Test that "auto" only estimates above the size threshold."""
+    session = RecordingSession(500_000)
+    assert await MockModel.count(session, mode="auto") == 500_000
+
+    session = RecordingSession(10, 7)
+    assert await MockModel.count(session, mode="auto", ttl=0) == 7
+
+
+@pytest.mark.asyncio
+async def test_base_mixin_stream_reads_batches_from_a_cursor():
+    """Test that streaming fetches `batch_size` rows at a time, without relationships."""
+    rows = [MockModel(name="A"), MockModel(name="B")]
+    session = RecordingSession(*rows)
+
+    streamed = [
+        instance
+        async for instance in MockModel.stream(
+            session, filters={"name": "A"}, batch_size=50
+        )
+    ]
+    assert streamed == rows
+
+    (query,) = session.statements
+    assert query.get_execution_options()["yield_per"] == 50
+    assert any("raise" in str(option.strategy) for option in query._with_options)
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "mock_model.deleted_at IS NULL" in sql
+
+
+def test_base_mixin_projection_selects_only_projected_columns():
+    """Test that a projection loads its columns, `id` and `deleted_at`, and no relationship."""
+    query = select(MockShelf).options(*MockShelf._projection_options(["name"]))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    selected = sql.split(" FROM ")[0]
+
+    assert "mock_shelf.name" in selected
+    assert "mock_shelf.id" in selected
+    assert "mock_shelf.deleted_at" in selected
+    assert "mock_shelf.description" not in selected
+    assert "mock_shelf.created_at" not in selected
+    # The eager `items` relationship is neither joined nor lazily loaded later
+    assert "mock_shelf_item" not in sql
+    strategies = [str(getattr(option, "strategy", "")) for option in query._with_options]
+    assert any("raise" in strategy for strategy in strategies)
+
+    # Without a projection, the full row and its eager relationship are loaded
+    sql = str(select(MockShelf).compile(dialect=postgresql.dialect()))
+    assert "mock_shelf.description" in sql
+    assert "mock_shelf_item" in sql
+
+
+def test_base_mixin_filter_reuses_query_shape():
+    """Test that filters differing only in values share one cached statement."""
+    first = MockModel._query_shape({"name": "A"}, None, [("name", "asc")])
+    second = MockModel._query_shape({"name": "B"}, None, [("name", "ASC")])
+    assert first == second
+    assert MockModel._build_query(first, True, False) is MockModel._build_query(
+        second, True, False
+    )
+
+
+def test_base_mixin_cursor_rejects_other_ordering():
+    """Test that a cursor can't be replayed against a different ordering."""
+    instance = MockModel(
+        id=UUID("00000000-0000-0000-0000-000000000001"), name="Test Instance"
+    )
+    cursor = MockModel.encode_cursor(instance, [("id", "asc")])
+    assert MockModel.decode_cursor(cursor, [("id", "asc")]) == [instance.id]
+    with pytest.raises(ValueError):
+        MockModel.decode_cursor(cursor, MockModel._keyset_order(None))
+
+
+def test_base_mixin_cursor_round_trips_enum_values():
+    """Test that Enum sort values are encoded by name and decoded into members."""
+    instance = MockStatusModel(
+        id=UUID("00000000-0000-0000-0000-000000000001"), status=MockStatus.published
+    )
+    order_by = MockStatusModel._keyset_order([("status", "asc")])
+    cursor = MockStatusModel.encode_cursor(instance, order_by)
+    assert MockStatusModel.decode_cursor(cursor, order_by) == [
+        MockStatus.published,
+        instance.id,
+    ]
+
+
+def test_base_mixin_cursor_ignores_direction_case():
+    """Test that a cursor matches its ordering however the directions are spelled."""
+    instance = MockModel(
+        id=UUID("00000000-0000-0000-0000-000000000001"), name="Test Instance"
+    )
+    cursor = MockModel.encode_cursor(
+        instance, MockModel._keyset_order([("name", "asc")])
+    )
+    order_by = MockModel._keyset_order([("name", "ASC")])
+    assert order_by == [("name", "asc"), ("id", "asc")]
+    assert MockModel.decode_cursor(cursor, order_by) == ["Test Instance", instance.id]
+
+
 # Specific model tests for User, UserInfo, Products, StockKeepingUnits, Articles, Order, etc.
 @pytest.mark.asyncio
 async def test_user_creation_with_info(session: AsyncSession):
@@ -0,0 +1,423 @@
+# tests/mixins/test_bulk_actions_models.py
+import enum
+import uuid
+import asyncio
+
+import pytest
+from sqlalchemy import Column, DateTime, Enum, Integer, String, Uuid, func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import declarative_base
+
+from app.models.common import bulk_actions_model
+from app.models.common.bulk_actions_model import BulkActionsMixin
+
+
+Base = declarative_base()
+
+
+class Status(enum.Enum):
+    draft = "Draft"
+    published = "Published"
+
+
+class BulkItem(Base, BulkActionsMixin):
+    __tablename__ = "bulk_item"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    name = Column(String)
+    status = Column(Enum(Status))
+    quantity = Column(Integer, default=1)
+    sku = Column(String, unique=True)
+    price = Column(Integer)
+    updated_at = Column(DateTime)
+
+
+class SavedBulkItem(Base, BulkActionsMixin):
+    __tablename__ = "saved_bulk_item"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    name = Column(String)
+    saved_at = Column(DateTime, default=func.now())
+
+
+class RecordingDriverConnection:
+    def __init__(self):
+        self.copies = []
+
+    async def copy_records_to_table(self, table, records, columns, schema_name=None):
+        self.copies.append((table, columns, records))
+
+
+class RecordingResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class RecordingSession:
+    """Stands in for an AsyncSession, recording statements, COPYs and commits."""
+
+    sync_session = None
+
+    def __init__(self, returned_ids=()):
+        self.returned_ids = list(returned_ids)
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.driver_connection = RecordingDriverConnection()
+
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        return RecordingResult(self.returned_ids)
+
+    async def connection(self):
+        driver_connection = self.driver_connection
+
+        class Connection:
+            async def get_raw_connection(self):
+                return type("Raw", (), {"driver_connection": driver_connection})()
+
+        return Connection()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_copies_large_batches():
+    """Test that COPY fills Python-side defaults and stores Enum members by name."""
+    session = RecordingSession()
+    items = [
+        {"id": uuid.uuid4(), "name": "Coat", "status": Status.published},
+        {"id": uuid.uuid4(), "name": "Scarf"},
+    ]
+    assert await BulkItem.bulk_create(session, items, use_copy=True) is None
+
+    [(table, columns, records)] = session.driver_connection.copies
+    assert table == "bulk_item"
+    assert columns == ["id", "name", "status", "quantity"]
+    assert records == [
+        (items[0]["id"], "Coat", "published", 1),
+        (items[1]["id"], "Scarf", None, 1),
+    ]
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_ids_through_a_staging_table():
+    """Test that COPY with `returning` goes through the staging table."""
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    session = RecordingSession(returned_ids=ids)
+    items = [{"id": _id, "name": "Coat"} for _id in ids]
+
+    assert await BulkItem.bulk_create(session, items, use_copy=True, returning=True) == ids
+
+    [(table, columns, records)] = session.driver_connection.copies
+    assert table == "_bulk_create_bulk_item"
+    sql = [str(statement) for statement, _ in session.statements]
+    assert sql[1].startswith('CREATE TEMP TABLE IF NOT EXISTS "_bulk_create_bulk_item"')
+    assert sql[2] == (
+        'INSERT INTO bulk_item ("id", "name", "quantity") '
+        'SELECT "id", "name", "quantity" FROM "_bulk_create_bulk_item" RETURNING id'
+    )
+    assert sql[3] == 'TRUNCATE "_bulk_create_bulk_item"'
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_inserts_when_sql_defaults_are_missing():
+    """Test that SQL expression defaults are left to INSERT instead of being copied."""
+    session = RecordingSession()
+    items = [{"id": uuid.uuid4(), "name": "Coat"}]
+    await SavedBulkItem.bulk_create(session, items, use_copy=True)
+
+    assert session.driver_connection.copies == []
+    [(statement, params)] = session.statements
+    assert statement.is_insert
+    assert params == items
+
+    # Rows that provide the value can still be copied, without the default
+    session = RecordingSession()
+    items[0]["saved_at"] = None
+    await SavedBulkItem.bulk_create(session, items, use_copy=True)
+    [(_, columns, records)] = session.driver_connection.copies
+    assert columns == ["id", "name", "saved_at"]
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_upsert_statement_applies_merge_rules():
+    """Test that each merge rule becomes its SET expression, refreshing `updated_at`."""
+    items = [{"id": uuid.uuid4(), "sku": "C-1", "name": "Coat", "quantity": 2, "price": 90}]
+    statement = BulkItem._upsert_statement(
+        items,
+        ("id", "name", "price", "quantity", "sku"),
+        ["sku"],
+        {"id": "keep", "name": "coalesce", "quantity": "add", "price": "least"},
+    )
+    sql = compile_sql(statement)
+    assert sql.endswith(
+        "ON CONFLICT (sku) DO UPDATE SET "
+        "name = coalesce(excluded.name, bulk_item.name), "
+        "quantity = (bulk_item.quantity + excluded.quantity), "
+        "price = least(bulk_item.price, excluded.price), "
+        "updated_at = now() "
+        "RETURNING bulk_item.id, xmax = 0 AS inserted"
+    )
+
+
+def test_upsert_statement_replaces_by_default_and_accepts_callables():
+    """Test the "replace" and "greatest" rules and custom merge expressions."""
+    _id = uuid.uuid4()
+    statement = BulkItem._upsert_statement(
+        [{"id": _id, "name": "Coat", "price": 90, "quantity": 2}],
+        ("id", "name", "price", "quantity"),
+        ["id"],
+        {
+            "price": "greatest",
+            "quantity": lambda existing, incoming: existing * incoming,
+        },
+    )
+    sql = compile_sql(statement)
+    assert sql.endswith(
+        "ON CONFLICT (id) DO UPDATE SET "
+        "name = excluded.name, "
+        "quantity = (bulk_item.quantity * excluded.quantity), "
+        "price = greatest(bulk_item.price, excluded.price), "
+        "updated_at = now() "
+        "RETURNING bulk_item.id, xmax = 0 AS inserted"
+    )
+
+
+def test_upsert_statement_does_nothing_when_every_column_is_kept():
+    """Test that keeping every column skips the update, and `updated_at` with it."""
+    _id = uuid.uuid4()
+    statement = BulkItem._upsert_statement(
+        [{"id": _id, "name": "Coat"}], ("id", "name"), ["id"], {"name": "keep"}
+    )
+    assert compile_sql(statement).endswith(
+        "ON CONFLICT (id) DO NOTHING RETURNING bulk_item.id, xmax = 0 AS inserted"
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_collapses_duplicate_keys():
+    """Test that the last item per conflict key wins, and rows are grouped by columns."""
+    session = RecordingSession()
+    await BulkItem.bulk_upsert(
+        session,
+        [
+            {"sku": "C-1", "name": "Coat"},
+            {"sku": "S-1", "name": "Scarf", "price": 20},
+            {"sku": "C-1", "name": "Trench coat"},
+        ],
+        unique_constraint=("sku",),
+    )
+
+    assert len(session.statements) == 2
+    first, second = (
+        statement.compile(dialect=postgresql.dialect()).params
+        for statement, _ in session.statements
+    )
+    assert (first["sku_m0"], first["name_m0"]) == ("C-1", "Trench coat")
+    assert "price_m0" not in first
+    assert (second["sku_m0"], second["name_m0"], second["price_m0"]) == ("S-1", "Scarf", 20)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_invalidates_the_returned_rows(monkeypatch):
+    """Test that exactly the written rows are invalidated, and counted."""
+    tracked = []
+    monkeypatch.setattr(
+        bulk_actions_model,
+        "track_cache_writes",
+        lambda session, model, ids=None: tracked.append((model, ids)),
+    )
+    inserted_id, updated_id = uuid.uuid4(), uuid.uuid4()
+    session = RecordingSession(returned_ids=[(inserted_id, True), (updated_id, False)])
+
+    counts = await BulkItem.bulk_upsert(
+        session,
+        [{"sku": "C-1", "name": "Coat"}, {"sku": "S-1", "name": "Scarf"}],
+        unique_constraint=("sku",),
+        return_counts=True,
+    )
+
+    assert counts == {"inserted": 1, "updated": 1}
+    assert tracked == [(BulkItem, [inserted_id, updated_id])]
+    [(statement, _)] = session.statements
+    # The statement itself only changes which rows queries return
+    assert statement.get_execution_options()["invalidates_cache"] == ()
+
+
+def test_values_update_joins_a_values_list():
+    """Test that one UPDATE applies a whole group through a VALUES join."""
+    items = [
+        {"id": uuid.uuid4(), "name": "Coat", "quantity": 2},
+        {"id": uuid.uuid4(), "name": "Scarf", "quantity": 5},
+    ]
+    statement = BulkItem._values_update(("name", "quantity"), items)
+    compiled = statement.compile(dialect=postgresql.dialect())
+
+    assert str(compiled) == (
+        "UPDATE bulk_item SET name=data.name, quantity=data.quantity "
+        "FROM (VALUES (%(param_1)s::UUID, %(param_2)s, %(param_3)s), "
+        "(%(param_4)s::UUID, %(param_5)s, %(param_6)s)) "
+        "AS data (id, name, quantity) WHERE bulk_item.id = data.id"
+    )
+    assert list(compiled.params.values()) == [
+        items[0]["id"], "Coat", 2, items[1]["id"], "Scarf", 5
+    ]
+    assert statement.get_execution_options()["invalidates_cache"] == [
+        item["id"] for item in items
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_groups_items_by_changed_columns():
+    """Test that items changing the same columns share a statement."""
+    ids = [uuid.uuid4() for _ in range(4)]
+    session = RecordingSession()
+    await BulkItem.bulk_update(
+        session,
+        [
+            {"id": ids[0], "name": "Coat"},
+            {"id": ids[1], "quantity": 3, "name": "Scarf"},
+            {"id": ids[2], "name": "Hat"},
+            {"id": ids[3]},
+        ],
+    )
+
+    statements = [statement for statement, _ in session.statements]
+    assert len(statements) == 2
+    assert "SET name=data.name FROM" in compile_sql(statements[0])
+    assert statements[0].get_execution_options()["invalidates_cache"] == [ids[0], ids[2]]
+    assert "SET name=data.name, quantity=data.quantity FROM" in compile_sql(statements[1])
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_merges_items_of_the_same_id():
+    """Test that later items for an id win, as if applied one after the other."""
+    _id, other_id = uuid.uuid4(), uuid.uuid4()
+    session = RecordingSession()
+    await BulkItem.bulk_update(
+        session,
+        [
+            {"id": _id, "name": "Coat"},
+            {"id": other_id, "name": "Scarf", "quantity": 1},
+            {"id": _id, "quantity": 3},
+            {"id": _id, "name": "Trench coat"},
+        ],
+    )
+
+    [(statement, _)] = session.statements
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert list(params.values()) == [_id, "Trench coat", 3, other_id, "Scarf", 1]
+
+
+@pytest.mark.asyncio
+async def test_run_chunked_rejects_invalid_settings():
+    """Test that chunking arguments are validated before any work is done."""
+    session = RecordingSession()
+
+    async def apply(chunk_session, chunk):
+        raise AssertionError("No chunk should run")
+
+    with pytest.raises(ValueError):
+        await BulkItem._run_chunked(session, [1, 2], 0, apply)
+    with pytest.raises(ValueError):
+        await BulkItem._run_chunked(session, [1, 2], 1, apply, concurrency=0)
+    with pytest.raises(ValueError):
+        await BulkItem._run_chunked(session, [1, 2], 1, apply, atomic=True, concurrency=2)
+
+
+@pytest.mark.asyncio
+async def test_run_chunked_commits_once_or_per_chunk():
+    """Test that atomic runs commit at the end, others after every chunk."""
+
+    async def apply(chunk_session, chunk):
+        return sum(chunk)
+
+    session = RecordingSession()
+    results = await BulkItem._run_chunked(session, [1, 2, 3, 4, 5], 2, apply)
+    assert results == [3, 7, 5]
+    assert session.commits == 1
+
+    session = RecordingSession()
+    await BulkItem._run_chunked(session, [1, 2, 3, 4, 5], 2, apply, atomic=False)
+    assert session.commits == 3
+
+
+@pytest.mark.asyncio
+async def test_run_chunked_rolls_back_a_failed_run():
+    """Test that a failing chunk rolls back what wasn't committed yet."""
+
+    async def apply(chunk_session, chunk):
+        if 3 in chunk:
+            raise RuntimeError("Chunk failed")
+
+    session = RecordingSession()
+    with pytest.raises(RuntimeError):
+        await BulkItem._run_chunked(session, [1, 2, 3, 4], 2, apply, atomic=False)
+    assert (session.commits, session.rollbacks) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_run_chunked_runs_concurrent_chunks_in_their_own_sessions(monkeypatch):
+    """Test the concurrency bound, per-chunk sessions and progress reports."""
+    sessions = []
+
+    def session_factory():
+        sessions.append(RecordingSession())
+        return sessions[-1]
+
+    monkeypatch.setattr(bulk_actions_model, "async_session_factory", session_factory)
+    running = max_running = 0
+
+    async def apply(chunk_session, chunk):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return list(chunk)
+
+    reports = []
+
+    async def progress(report):
+        reports.append(report)
+
+    caller_session = RecordingSession()
+    results = await BulkItem._run_chunked(
+        caller_session,
+        list(range(10)),
+        2,
+        apply,
+        atomic=False,
+        concurrency=2,
+        progress=progress,
+    )
+
+    assert results == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+    assert max_running == 2
+    assert caller_session.commits == 0
+    assert [chunk_session.commits for chunk_session in sessions] == [1] * 5
+    assert [report["chunks_done"] for report in reports] == [1, 2, 3, 4, 5]
+    assert reports[-1]["rows_done"] == reports[-1]["rows_total"] == 10
+    assert reports[-1]["chunks_total"] == 5
@@ -0,0 +1,94 @@
+# tests/mixins/test_cache_invalidation.py
+import uuid
+
+import pytest
+from sqlalchemy import Column, String, Uuid, create_engine, delete, insert, update
+from sqlalchemy.orm import Session, declarative_base
+
+from app.models.common import cache_invalidation
+from app.models.common.cache_model import CachingMixin
+from app.models.common.cache_invalidation import wait_for_cache_invalidations
+
+
+Base = declarative_base()
+
+
+class CachedItem(Base, CachingMixin):
+    __tablename__ = "cached_item"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    name = Column(String)
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    """Records the writes invalidated after each commit instead of sending them to Redis."""
+    calls = []
+
+    async def record(writes):
+        calls.append(writes)
+
+    monkeypatch.setattr(cache_invalidation, "invalidate_cache_writes", record)
+    return calls
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_commit_invalidates_flushed_instances(session, invalidated):
+    """Test that committed inserts, updates and deletes invalidate their rows."""
+    item = CachedItem(id=uuid.uuid4(), name="Coat")
+    session.add(item)
+    session.commit()
+    await wait_for_cache_invalidations(session)
+    assert invalidated == [{CachedItem: {item.id}}]
+
+    item.name = "Trench coat"
+    session.commit()
+    session.delete(item)
+    session.commit()
+    await wait_for_cache_invalidations(session)
+    assert invalidated[1:] == [{CachedItem: {item.id}}, {CachedItem: {item.id}}]
+
+
+@pytest.mark.asyncio
+async def test_rollback_drops_tracked_writes(session, invalidated):
+    """Test that rolled back transactions invalidate nothing."""
+    session.add(CachedItem(name="Coat"))
+    session.flush()
+    session.rollback()
+
+    session.commit()
+    await wait_for_cache_invalidations(session)
+    assert invalidated == []
+
+
+@pytest.mark.asyncio
+async def test_statements_invalidate_the_ids_they_name(session, invalidated):
+    """Test that the `invalidates_cache` option narrows statements to the given ids."""
+    first, second = uuid.uuid4(), uuid.uuid4()
+    session.execute(insert(CachedItem), [{"id": first}, {"id": second}])
+    session.commit()
+
+    session.execute(
+        update(CachedItem)
+        .where(CachedItem.id == first)
+        .values(name="Coat")
+        .execution_options(invalidates_cache=[first])
+    )
+    session.commit()
+    session.execute(delete(CachedItem).where(CachedItem.name == "Coat"))
+    session.commit()
+    await wait_for_cache_invalidations(session)
+
+    # Inserted ids drop their "not found" entries
+    assert invalidated[0] == {CachedItem: {first, second}}
+    assert invalidated[1] == {CachedItem: {first}}
+    # Without the option, the whole model is invalidated
+    assert invalidated[2] == {CachedItem: None}
@@ -0,0 +1,327 @@
+# tests/mixins/test_cache_lookups.py
+import time
+import uuid
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Column, DateTime, String, Uuid
+from sqlalchemy.orm import declarative_base
+
+from app.models.common import cache_model
+from app.models.common.cache_model import CachingMixin
+
+
+Base = declarative_base()
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.commands = []
+
+    def _alive(self, key):
+        if key in self.expiry and self.expiry[key] <= time.monotonic():
+            self.data.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.data
+
+    async def get(self, key):
+        self.commands.append(("get", key))
+        return self.data[key] if self._alive(key) else None
+
+    async def mget(self, keys):
+        self.commands.append(("mget", list(keys)))
+        return [self.data[key] if self._alive(key) else None for key in keys]
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        self.commands.append(("set", key))
+        if nx and self._alive(key):
+            return None
+        self.data[key] = value
+        self.expiry.pop(key, None)
+        if ex or px:
+            self.expiry[key] = time.monotonic() + (ex if ex else px / 1000)
+        return True
+
+    async def delete(self, *keys):
+        self.commands.append(("delete", keys))
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def publish(self, channel, message):
+        return 0
+
+    async def eval(self, script, numkeys, key, token):
+        # The lease release script
+        self.commands.append(("release", key))
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        self.redis.commands.append(("pipeline", [name for name, _, _ in self.queued]))
+        queued, self.queued = self.queued, []
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in queued
+        ]
+
+
+class CachedItem(Base, CachingMixin):
+    __tablename__ = "cached_lookup_item"
+
+    id = Column(Uuid, primary_key=True)
+    name = Column(String)
+    deleted_at = Column(DateTime)
+
+    # Rows by id, and the database calls made
+    rows: dict = {}
+    queries: list = []
+
+    @classmethod
+    async def get_by_id(cls, db_session, _id):
+        cls.queries.append(("get_by_id", _id))
+        await asyncio.sleep(0.01)
+        return cls.rows.get(_id)
+
+    @classmethod
+    async def get_by_ids(cls, db_session, ids, projection=None):
+        cls.queries.append(("get_by_ids", list(ids)))
+        return [cls.rows[_id] for _id in ids if _id in cls.rows]
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    """Serves CachedItem from a fake Redis and an in-memory table."""
+    fake = FakeRedis()
+
+    async def get_redis(cls):
+        return fake
+
+    monkeypatch.setattr(CachedItem, "get_redis", classmethod(get_redis))
+    monkeypatch.setattr(
+        CachedItem, "_ensure_invalidation_listener", classmethod(lambda cls: None)
+    )
+    CachedItem.rows = {}
+    CachedItem.queries = []
+    yield fake
+    cache_model._generations.clear()
+    cache_model._last_generations.clear()
+
+
+def add_rows(*names, deleted=()):
+    rows = []
+    for name in names:
+        row = CachedItem(
+            id=uuid.uuid4(),
+            name=name,
+            deleted_at=datetime(2024, 1, 1) if name in deleted else None,
+        )
+        CachedItem.rows[row.id] = row
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_cached_query_leaves_out_soft_deleted_rows(redis):
+    """Test that query results are the same whether they come from the cache or not."""
+    rows = add_rows("Coat", "Scarf", "Hat", deleted=("Scarf",))
+
+    async def fetch():
+        return rows
+
+    query = {"filter": "all"}
+    missed = await CachedItem.cached_query(None, query, fetch)
+    hit = await CachedItem.cached_query(None, query, fetch)
+
+    assert [row.name for row in missed] == ["Coat", "Hat"]
+    assert [row.name for row in hit] == ["Coat", "Hat"]
+    # The hit was resolved through the per-id cache the miss back-filled
+    assert CachedItem.queries == []
+
+
+def cache_key(_id) -> str:
+    # Generation counters start at 0
+    return CachedItem._generate_cache_key(_id, generation="0")
+
+
+def cache_entry(row, ttl=3600, load_time=0.01) -> bytes:
+    return cache_model._pack_entry(CachedItem._dump_payload(row), ttl, load_time)
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(cache_model, "CACHE_LOCK_POLL_INTERVAL", 0.005)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(redis):
+    """Test that concurrent misses share a single database load and lease."""
+    (row,) = add_rows("Coat")
+
+    results = await asyncio.gather(
+        *(CachedItem.cached_get_by_id(None, row.id) for _ in range(5))
+    )
+
+    assert [result.name for result in results] == ["Coat"] * 5
+    assert CachedItem.queries == [("get_by_id", row.id)]
+    # The lease was released, and the entry cached
+    assert ("release", f"lock:{cache_key(row.id)}") in redis.commands
+    assert f"lock:{cache_key(row.id)}" not in redis.data
+    assert cache_key(row.id) in redis.data
+
+
+@pytest.mark.asyncio
+async def test_caller_without_the_lease_receives_the_holders_entry(redis, fast_polling):
+    """Test that a worker without the lease polls for the holder's result."""
+    (row,) = add_rows("Coat")
+    key = cache_key(row.id)
+    await redis.set(f"lock:{key}", "other worker", px=5000)
+
+    lookup = asyncio.ensure_future(CachedItem.cached_get_by_id(None, row.id))
+    await asyncio.sleep(0.02)
+    assert not lookup.done()
+
+    # The holder caches the row and releases its lease
+    await redis.set(key, cache_entry(row))
+    del redis.data[f"lock:{key}"]
+
+    assert (await lookup).name == "Coat"
+    assert CachedItem.queries == []
+
+
+@pytest.mark.asyncio
+async def test_caller_loads_itself_once_the_lease_is_gone(redis, fast_polling, monkeypatch):
+    """Test the fallbacks when the holder releases without a result or never does."""
+    first, second = add_rows("Coat", "Scarf")
+    await redis.set(f"lock:{cache_key(first.id)}", "other worker", px=5000)
+
+    lookup = asyncio.ensure_future(CachedItem.cached_get_by_id(None, first.id))
+    await asyncio.sleep(0.02)
+    # The holder failed, releasing its lease without caching anything
+    del redis.data[f"lock:{cache_key(first.id)}"]
+    assert (await lookup).name == "Coat"
+
+    # A holder that hangs is waited for at most CACHE_LOCK_TIMEOUT
+    monkeypatch.setattr(cache_model, "CACHE_LOCK_TIMEOUT", 0.05)
+    await redis.set(f"lock:{cache_key(second.id)}", "other worker")
+    assert (await CachedItem.cached_get_by_id(None, second.id)).name == "Scarf"
+
+    assert CachedItem.queries == [("get_by_id", first.id), ("get_by_id", second.id)]
+
+
+@pytest.mark.asyncio
+async def test_waiters_load_themselves_when_the_leading_load_fails(redis, monkeypatch):
+    """Test that a failed load releases its lease and doesn't fail the waiters."""
+    (row,) = add_rows("Coat")
+    get_by_id = CachedItem.get_by_id
+
+    async def failing_once(cls, db_session, _id):
+        if not CachedItem.queries:
+            CachedItem.queries.append(("failed", _id))
+            await asyncio.sleep(0.01)
+            raise RuntimeError("Database unavailable")
+        return await get_by_id(db_session, _id)
+
+    monkeypatch.setattr(CachedItem, "get_by_id", classmethod(failing_once))
+    leader, waiter = await asyncio.gather(
+        CachedItem.cached_get_by_id(None, row.id),
+        CachedItem.cached_get_by_id(None, row.id),
+        return_exceptions=True,
+    )
+
+    assert isinstance(leader, RuntimeError)
+    assert waiter.name == "Coat"
+    assert f"lock:{cache_key(row.id)}" not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_entries_near_expiry_are_refreshed_in_the_background(redis, monkeypatch):
+    """Test that a read close to expiry answers at once and schedules a refresh."""
+
+    class Session:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *exc_info):
+            pass
+
+    monkeypatch.setattr(cache_model, "async_session_factory", Session)
+    (row,) = add_rows("Coat")
+    (fresh,) = add_rows("Scarf")
+    await redis.set(cache_key(fresh.id), cache_entry(fresh))
+    await CachedItem.cached_get_by_id(None, fresh.id)
+    assert cache_model._refresh_tasks == {}
+
+    # Cached as "Coat", renamed since, and expiring now
+    await redis.set(cache_key(row.id), cache_entry(row, ttl=0))
+    row.name = "Trench coat"
+
+    assert (await CachedItem.cached_get_by_id(None, row.id)).name == "Coat"
+    refresh = cache_model._refresh_tasks[cache_key(row.id)]
+    await refresh
+
+    assert CachedItem.queries == [("get_by_id", row.id)]
+    cached = CachedItem._decode_entry(redis.data[cache_key(row.id)])[0]
+    assert cached.name == "Trench coat"
+
+
+@pytest.mark.asyncio
+async def test_cached_get_by_ids_batches_every_step(redis):
+    """Test one MGET, one query for the misses, and one pipelined back-fill."""
+    cached, missed, deleted = add_rows("Coat", "Scarf", "Hat", deleted=("Hat",))
+    await redis.set(cache_key(cached.id), cache_entry(cached))
+    missing_id = uuid.uuid4()
+    redis.commands.clear()
+
+    ids = [missing_id, missed.id, deleted.id, cached.id, missed.id]
+    results = await CachedItem.cached_get_by_ids(None, ids)
+
+    # In input order, without missing, soft deleted or repeated ids
+    assert [row.name for row in results] == ["Scarf", "Coat"]
+    mgets = [command for command in redis.commands if command[0] == "mget"]
+    assert mgets == [
+        ("mget", ["gen:CachedItem"]),
+        ("mget", [cache_key(_id) for _id in ids[:4]]),
+    ]
+    assert CachedItem.queries == [("get_by_ids", [missing_id, missed.id, deleted.id])]
+    # The found row and the missing ids are written back together
+    pipelines = [command for command in redis.commands if command[0] == "pipeline"]
+    assert pipelines == [("pipeline", ["set", "set", "set"])]
+
+    # Missing ids now have negative entries, and everything is served from Redis
+    entry = redis.data[cache_key(missing_id)]
+    assert CachedItem._decode_entry(entry)[0] is cache_model._NOT_FOUND
+    CachedItem.queries.clear()
+    results = await CachedItem.cached_get_by_ids(None, ids)
+    assert [row.name for row in results] == ["Scarf", "Coat"]
+    assert CachedItem.queries == []
@@ -0,0 +1,255 @@
+# tests/mixins/test_cache_models.py
+import enum
+import time
+import uuid
+import asyncio
+from decimal import Decimal
+
+import msgpack
+import pytest
+from redis.exceptions import ConnectionError
+from sqlalchemy import Column, Enum, String, Uuid, inspect
+from sqlalchemy.orm import declarative_base
+
+from app.models.common import cache_model
+from app.models.common.cache_model import CachingMixin, _pack_entry
+from app.models.common.local_cache import LocalCache
+from app.models.common.cache_redis import CacheUnavailableError, CircuitBreaker
+from app.models.common.cache_serializer import MsgpackSerializer, model_schema
+from app.models.pricing.pricing_tiers_model import PricingTier
+from app.models.products.core.products_model import Products
+
+
+def test_local_cache_evicts_least_recently_used():
+    """Test that the L1 cache stays within its size bound, evicting the LRU entry."""
+    cache = LocalCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_local_cache_expires_entries():
+    """Test that L1 entries expire after their TTL, capped at the cache TTL."""
+    cache = LocalCache(maxsize=10, ttl=0.05)
+    cache.set("a", 1, ttl=3600)
+    assert cache.get("a") == 1
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_msgpack_serializer_round_trip():
+    """Test that cached column values rehydrate into a detached instance."""
+    tier = PricingTier(
+        id=uuid.uuid4(),
+        retail_price=Decimal("129.90"),
+        tax_percentage=Decimal("0.21"),
+        category_id=uuid.uuid4(),
+    )
+    serializer = MsgpackSerializer()
+
+    cached = serializer.loads(PricingTier, serializer.dumps(tier))
+    assert inspect(cached).detached
+    assert cached.id == tier.id
+    assert cached.retail_price == Decimal("129.90")
+    assert cached.category_id == tier.category_id
+    assert "insurance" in inspect(cached).unloaded
+
+
+def test_msgpack_serializer_ignores_other_schema_versions():
+    """Test that payloads written for another schema version are treated as misses."""
+    serializer = MsgpackSerializer()
+    data = msgpack.packb(["00000000", []])
+    assert serializer.loads(PricingTier, data) is None
+
+
+def test_large_payloads_are_compressed():
+    """Test that payloads above the model's threshold are stored compressed."""
+    product = Products(
+        id=uuid.uuid4(), name="Silk dress", description="Hand-finished silk. " * 100
+    )
+    payload = Products._dump_payload(product)
+    assert payload[:1] == b"\x01"
+    assert len(payload) < len(product.description)
+
+    cached = Products._load_payload(payload)
+    assert cached.description == product.description
+
+    tier = PricingTier(id=uuid.uuid4(), retail_price=Decimal("10"))
+    assert PricingTier._dump_payload(tier)[:1] == b"\x00"
+
+
+def test_cache_key_embeds_generation():
+    """Test that bumping a generation moves a model's entries to new keys."""
+    _id = uuid.uuid4()
+    key = PricingTier._generate_cache_key(_id, generation="1")
+    assert key.startswith("PricingTier:1:")
+    assert key != PricingTier._generate_cache_key(_id, generation="2")
+    assert key == PricingTier._generate_cache_key(str(_id), generation="1")
+
+
+def test_circuit_breaker_opens_and_lets_a_trial_through():
+    """Test that repeated failures skip Redis until a trial command succeeds."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()  # The trial command
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+Base = declarative_base()
+
+
+class LocallyCachedItem(Base, CachingMixin):
+    __tablename__ = "locally_cached_item"
+
+    local_cache_size = 10
+
+    id = Column(Uuid, primary_key=True)
+    name = Column(String)
+
+
+class UnavailableRedis:
+    def __getattr__(self, name):
+        async def command(*args, **kwargs):
+            raise CacheUnavailableError("Redis is unavailable, circuit breaker is open")
+
+        return command
+
+
+@pytest.fixture
+def redis_down(monkeypatch):
+    """Makes every Redis command fail, and keeps the invalidation listener from starting."""
+
+    async def get_redis(cls):
+        return UnavailableRedis()
+
+    monkeypatch.setattr(LocallyCachedItem, "get_redis", classmethod(get_redis))
+    monkeypatch.setattr(
+        LocallyCachedItem, "_ensure_invalidation_listener", classmethod(lambda cls: None)
+    )
+    yield
+    cache_model._local_caches.clear()
+    cache_model._generations.clear()
+    cache_model._last_generations.clear()
+
+
+@pytest.mark.asyncio
+async def test_local_cache_serves_while_redis_is_unavailable(redis_down):
+    """Test that the L1 cache keeps serving with the last known generations."""
+    item = LocallyCachedItem(id=uuid.uuid4(), name="Coat")
+    LocallyCachedItem._apply_invalidation({"tag": "LocallyCachedItem", "generation": 3})
+    key = LocallyCachedItem._generate_cache_key(item.id, generation="3")
+    local_cache = LocallyCachedItem._get_local_cache()
+    local_cache.set(key, _pack_entry(LocallyCachedItem._dump_payload(item), 3600, 0.01))
+    # The generation counter is due to be read from Redis again
+    cache_model._generations.clear()
+
+    cached = await LocallyCachedItem.cached_get_by_id(None, item.id)
+    assert cached.name == "Coat"
+
+    # Without a known generation, lookups go to the database
+    LocallyCachedItem._apply_invalidation({"tag": "LocallyCachedItem"})
+    with pytest.raises(CacheUnavailableError):
+        await LocallyCachedItem._get_generation()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listener_clears_local_caches_once_resubscribed(
+    redis_down, monkeypatch
+):
+    """Test that L1 caches survive a lost subscription until it is restored."""
+    subscribed = asyncio.Event()
+
+    class PubSub:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            pass
+
+        async def subscribe(self, channel):
+            pass
+
+        async def listen(self):
+            subscribed.set()
+            await asyncio.Event().wait()
+            yield
+
+    attempts = []
+
+    async def get_pubsub_redis(cls):
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise ConnectionError("Connection refused")
+        return type("PubSubRedis", (), {"pubsub": lambda self: PubSub()})()
+
+    monkeypatch.setattr(
+        LocallyCachedItem, "get_pubsub_redis", classmethod(get_pubsub_redis)
+    )
+    local_cache = LocallyCachedItem._get_local_cache()
+    local_cache.set("key", b"entry")
+
+    listener = asyncio.ensure_future(LocallyCachedItem._listen_for_invalidations())
+    try:
+        await asyncio.sleep(0.05)
+        assert attempts and local_cache.get("key") == b"entry"
+
+        await asyncio.wait_for(subscribed.wait(), timeout=2)
+        assert local_cache.get("key") is None
+    finally:
+        listener.cancel()
+
+
+class Status(enum.Enum):
+    draft = "Draft"
+    published = "Published"
+
+
+class RenamedStatus(enum.Enum):
+    draft = "Draft"
+    live = "Published"
+
+
+class StatusItem(Base, CachingMixin):
+    __tablename__ = "status_item"
+
+    id = Column(Uuid, primary_key=True)
+    status = Column(Enum(Status))
+
+
+class RenamedStatusItem(Base, CachingMixin):
+    __tablename__ = "renamed_status_item"
+
+    id = Column(Uuid, primary_key=True)
+    status = Column(Enum(RenamedStatus))
+
+
+def test_schema_version_covers_enum_members():
+    """Test that renaming an Enum member changes the schema version."""
+    assert model_schema(StatusItem)[0] != model_schema(RenamedStatusItem)[0]
+
+
+def test_msgpack_serializer_treats_unknown_enum_members_as_misses():
+    """Test that payloads naming a member that no longer exists can't be loaded."""
+    serializer = MsgpackSerializer()
+    item = StatusItem(id=uuid.uuid4(), status=Status.published)
+    assert serializer.loads(StatusItem, serializer.dumps(item)).status is Status.published
+
+    item.__dict__["status"] = RenamedStatus.live
+    assert serializer.loads(StatusItem, serializer.dumps(item)) is None
@@ -0,0 +1,93 @@
+# tests/mixins/test_data_loader.py
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, DateTime, Uuid, create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import declarative_base
+
+from app.models.common.data_loader import SessionLoader
+
+
+Base = declarative_base()
+
+
+class StubModel:
+    """Stands in for a mapped model, recording how its batches are loaded."""
+
+    batches: list[list[uuid.UUID]] = []
+    running = 0
+    max_running = 0
+
+    @classmethod
+    async def get_by_ids(cls, db_session, ids, projection=None):
+        cls.batches.append(list(ids))
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        await asyncio.sleep(0.01)
+        cls.running -= 1
+        return [SimpleNamespace(id=_id, deleted_at=None) for _id in ids]
+
+
+@pytest.mark.asyncio
+async def test_loader_batches_lookups_of_the_same_tick():
+    """Test that lookups issued together are answered by one query."""
+    StubModel.batches = []
+    loader = SessionLoader(AsyncSession())
+    ids = [uuid.uuid4() for _ in range(3)]
+
+    results = await asyncio.gather(*(loader.load(StubModel, _id) for _id in ids))
+    assert [result.id for result in results] == ids
+    assert StubModel.batches == [ids]
+
+
+@pytest.mark.asyncio
+async def test_loader_never_runs_batches_concurrently():
+    """Test that batches dispatched on separate ticks wait for each other."""
+    StubModel.batches = []
+    StubModel.max_running = 0
+    loader = SessionLoader(AsyncSession())
+
+    async def lookup(delay: float):
+        await asyncio.sleep(delay)
+        return await loader.load(StubModel, uuid.uuid4())
+
+    results = await asyncio.gather(*(lookup(i * 0.001) for i in range(3)))
+    assert all(result is not None for result in results)
+    assert len(StubModel.batches) == 3
+    assert StubModel.max_running == 1
+
+
+class LoadedRow(Base):
+    """Mapped model whose batches query the session's own (sqlite) connection."""
+
+    __tablename__ = "loaded_row"
+
+    id = Column(Uuid, primary_key=True)
+    deleted_at = Column(DateTime)
+
+    @classmethod
+    async def get_by_ids(cls, db_session, ids, projection=None):
+        query = select(cls).where(cls.id.in_(ids))
+        return db_session.sync_session.execute(query).scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_loader_forgets_results_once_the_session_writes():
+    """Test that a row flushed after a lookup is found by the next one."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = AsyncSession()
+    session.sync_session.bind = engine
+    loader = SessionLoader.for_session(session)
+    _id = uuid.uuid4()
+
+    assert await loader.load(LoadedRow, _id) is None
+    session.sync_session.add(LoadedRow(id=_id))
+    session.sync_session.flush()
+    assert (await loader.load(LoadedRow, _id)).id == _id
+
+    session.sync_session.close()
+    assert loader._results == {}
@@ -0,0 +1,96 @@
+# tests/mixins/test_search_models.py
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.models.common import Base, BaseMixin, SearchMixin
+from app.models.products.core.products_model import Products
+from app.models.products.product_details.brand_model import Brand
+
+
+def test_search_fields_are_stored_in_an_indexed_vector():
+    """Test that declared search fields become a generated, GIN-indexed tsvector."""
+    dialect = postgresql.dialect()
+    ddl = str(CreateTable(Products.__table__).compile(dialect=dialect))
+    assert "search_vector TSVECTOR GENERATED ALWAYS AS" in ddl
+    assert "coalesce(name, '')), 'A')" in ddl
+
+    (index,) = [
+        index
+        for index in Products.__table__.indexes
+        if index.name == "ix_products_search_vector"
+    ]
+    assert "USING gin (search_vector)" in str(CreateIndex(index).compile(dialect=dialect))
+
+
+def test_search_uses_the_stored_vector_for_its_search_fields():
+    """Test that only searches over the declared fields use the stored vector."""
+    assert Products._search_vector() is Products.search_vector
+    assert Products._search_vector(["description", "name"]) is Products.search_vector
+    assert Products._search_vector(["name"]) is not Products.search_vector
+    assert "search_vector" not in Brand.__table__.c
+
+
+def test_fuzzy_fields_get_trigram_indexes():
+    """Test that fuzzy fields are indexed by trigrams of their lowercased value."""
+    (index,) = [
+        index
+        for index in Products.__table__.indexes
+        if index.name == "ix_products_name_trgm"
+    ]
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "USING gin (lower(name) gin_trgm_ops)" in ddl
+
+
+def test_fuzzy_distance_compares_runs_of_words():
+    """Test that re-ranking measures the term against the closest run of words."""
+    product = Products(name="Silk Evening Dress")
+    assert Products._fuzzy_distance(product, "evenng dres", ["name"]) == 2
+    assert Products._fuzzy_distance(product, "silk", ["name"]) == 0
+    # Unloaded fields are skipped rather than lazily loaded
+    assert Products._fuzzy_distance(product, "silk", ["description"]) == 4
+
+
+def test_default_fields_leave_out_the_search_vector():
+    """Test that exports and fallback searches only use plain columns."""
+    columns = Products._plain_columns()
+    assert "name" in columns and "description" in columns
+    assert "search_vector" not in columns
+    assert set(Products._text_columns()) <= set(columns)
+
+
+class SearchedNote(Base, BaseMixin, SearchMixin):
+    __tablename__ = "searched_note"
+    # Full-text searched, without a trigram index
+    search_fields = {"title": "A"}
+
+    title = Column(String)
+    body = Column(String)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_needs_fuzzy_fields():
+    """Test that the trigram threshold is only set when some field is fuzzy matched."""
+    session = RecordingSession()
+    await SearchedNote.search(session, "notes")
+    (query,) = session.statements
+    assert " %% " not in query
+
+    # Fields searched explicitly are fuzzy matched, indexed or not
+    session = RecordingSession()
+    await SearchedNote.search(session, "notes", fields=["body"])
+    set_threshold, query = session.statements
+    assert "set_config" in set_threshold
+    assert "lower(searched_note.body) %% lower(" in query
@@ -0,0 +1,99 @@
+# tests/routers/test_streaming_response.py
+import csv
+import enum
+import io
+import json
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.routers.common import streaming_response
+from app.routers.common.streaming_response import stream_model_response
+
+
+class Size(enum.Enum):
+    small = "S"
+    large = "L"
+
+
+async def as_rows(rows):
+    for row in rows:
+        yield row
+
+
+async def collect(chunks) -> list[str]:
+    return [chunk async for chunk in chunks]
+
+
+def test_values_are_serialized_for_export():
+    """Test that Enum members, decimals and ids are exported as plain values."""
+    assert streaming_response._serialize_value(Size.large) == "L"
+    assert streaming_response._serialize_value(Decimal("9.90")) == "9.90"
+    _id = uuid.uuid4()
+    assert streaming_response._serialize_value(_id) == str(_id)
+    # JSON and ARRAY values are left to each format
+    assert streaming_response._serialize_value({"a": 1}) == {"a": 1}
+    assert streaming_response._serialize_value(["a", None]) == ["a", None]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_is_written_in_chunks(monkeypatch):
+    """Test that NDJSON rows are grouped into chunks and keep JSON values as JSON."""
+    monkeypatch.setattr(streaming_response, "CHUNK_ROWS", 2)
+    rows = [{"name": f"Item {i}", "attributes": {"size": None}} for i in range(5)]
+
+    chunks = await collect(streaming_response._ndjson_chunks(as_rows(rows)))
+
+    assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+    lines = "".join(chunks).splitlines()
+    assert [json.loads(line) for line in lines] == rows
+
+
+@pytest.mark.asyncio
+async def test_csv_is_written_in_chunks(monkeypatch):
+    """Test that CSV starts with a header and encodes JSON values as JSON."""
+    monkeypatch.setattr(streaming_response, "CHUNK_ROWS", 2)
+    rows = [{"name": f"Item {i}", "tags": ["new", None]} for i in range(3)]
+
+    chunks = await collect(streaming_response._csv_chunks(as_rows(rows), ["name", "tags"]))
+
+    assert len(chunks) == 2
+    parsed = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert [row["name"] for row in parsed] == ["Item 0", "Item 1", "Item 2"]
+    assert json.loads(parsed[0]["tags"]) == ["new", None]
+
+
+@pytest.mark.asyncio
+async def test_stream_model_response_exports_plain_columns(monkeypatch):
+    """Test that exports default to the model's plain columns, read on their own session."""
+
+    class Session:
+        async def __aenter__(self):
+            return "export session"
+
+        async def __aexit__(self, *exc_info):
+            pass
+
+    class Model:
+        streamed = []
+
+        @classmethod
+        def _plain_columns(cls):
+            return ["name", "size"]
+
+        @classmethod
+        async def stream(cls, db_session, projection=None, **stream_kwargs):
+            cls.streamed.append((db_session, projection, stream_kwargs))
+            yield SimpleNamespace(name="Coat", size=Size.small)
+
+    monkeypatch.setattr(streaming_response, "async_session_factory", Session)
+    response = stream_model_response(Model, filters={"name": "Coat"})
+    body = "".join(await collect(response.body_iterator))
+
+    assert response.media_type == "application/x-ndjson"
+    assert json.loads(body) == {"name": "Coat", "size": "S"}
+    assert Model.streamed == [
+        ("export session", ["name", "size"], {"filters": {"name": "Coat"}})
+    ]